@@ -2,21 +2,41 @@
 # COELIACS LIKE BEER TOO - UPDATED APP.PY FOR OSM SCHEMA
 # ================================================================================
 
-from flask import Flask, request, jsonify, render_template, redirect
+from flask import Flask, request, jsonify, render_template, redirect, make_response, g
+from flask.json.provider import DefaultJSONProvider
 import mysql.connector
+import mysql.connector.pooling
 import os
 from dotenv import load_dotenv
 import logging
 import time
 import json
+import traceback
+from functools import wraps
+from operator import itemgetter
+from itertools import islice
+import bisect
+import gzip
+import zlib
+import threading
+import tempfile
+from concurrent.futures import Future
+import orjson
+from cachetools import TTLCache
+from flask_compress import Compress
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import math
 import random
 import hashlib
+import hmac
 import secrets
 import string
 
+from fulltext import fulltext_prefix_query
+
 # Initialize Flask app
 app = Flask(__name__, 
             static_folder='static',
@@ -25,41 +45,210 @@ app = Flask(__name__,
 # Load environment variables
 load_dotenv()
 
+# Compiled templates are cached by Jinja; only re-check the files on disk in development
+app.config['TEMPLATES_AUTO_RELOAD'] = os.getenv('FLASK_ENV') == 'development'
+
+# Compress JSON and HTML on the way out. Responses that already carry a
+# Content-Encoding (the prebuilt /api/all-venues gzip) are left alone.
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+app.config['COMPRESS_LEVEL'] = 5
+app.config['COMPRESS_BR_LEVEL'] = 5
+app.config['COMPRESS_MIN_SIZE'] = 512
+Compress(app)
+
 # Database configuration
 db_config = {
     "host": os.getenv("DB_HOST", "localhost"),
     "user": os.getenv("DB_USER"),
     "password": os.getenv("DB_PASSWORD"),
     "database": os.getenv("DB_NAME"),
-    "ssl_disabled": os.getenv("DB_SSL_DISABLED", "false").lower() == "true"
+    "ssl_disabled": os.getenv("DB_SSL_DISABLED", "false").lower() == "true",
+    # The C extension blocks inside libmysqlclient, which stalls every other
+    # greenlet in a gevent worker (see gunicorn.conf.py). The pure-Python
+    # protocol goes through the patched socket module and yields instead.
+    # Thread or sync workers don't have that problem and get the faster C
+    # row decoding; DB_USE_PURE overrides either way.
+    "use_pure": os.getenv(
+        "DB_USE_PURE",
+        "true" if os.getenv("GUNICORN_WORKER_CLASS", "gevent") == "gevent" else "false"
+    ).lower() == "true"
 }
 
+# Outbound HTTP shares one keep-alive pool per worker, so repeat calls to the
+# same host skip the TCP and TLS handshakes. Idempotent requests retry twice
+# on connection errors and 5xx responses.
+_http = requests.Session()
+_http.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+))
+
+# Connection pool, created on first use so the app can import without a database.
+# Sized per worker process; mysql.connector caps a pool at 32 connections. A
+# gevent worker holds up to worker_connections requests at once (see
+# gunicorn.conf.py), so it defaults to the cap rather than falling back to
+# one-off connections under load.
+DB_POOL_SIZE = min(int(os.getenv(
+    "DB_POOL_SIZE",
+    32 if os.getenv("GUNICORN_WORKER_CLASS", "gevent") == "gevent" else 10
+)), 32)
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+def get_db_pool():
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                use_cext = not db_config['use_pure'] and mysql.connector.HAVE_CEXT
+                if not db_config['use_pure'] and not use_cext:
+                    logger.warning("MySQL C extension not installed - using the pure-Python driver")
+                _db_pool = mysql.connector.pooling.MySQLConnectionPool(
+                    pool_name='gf_beer', pool_size=DB_POOL_SIZE, **db_config)
+                logger.info(f"MySQL pool of {DB_POOL_SIZE} connections, "
+                            f"{'C extension' if use_cext else 'pure-Python'} protocol")
+    return _db_pool
+
+# Cursors are buffered (the driver default) unless noted: request queries are
+# LIMITed to a page, and a buffered cursor frees the connection for the next
+# statement straight away. The two unbounded reads - the map payload and the
+# brewery index - are unbuffered and consume rows as they arrive, so the full
+# result set is never held twice.
+def get_db():
+    """Pooled connection for the current request, released by close_db"""
+    if 'db' not in g:
+        try:
+            g.db = get_db_pool().get_connection()
+        except mysql.connector.errors.PoolError:
+            # Pool exhausted - a gevent worker can hold more requests than
+            # connections, so fall back to a one-off connection
+            logger.warning("Connection pool exhausted, opening a direct connection")
+            g.db = mysql.connector.connect(**db_config)
+    return g.db
+
+@app.teardown_request
+def close_db(exc):
+    db = g.pop('db', None)
+    if db is not None:
+        db.close()
+
+def asset_version():
+    """Hash of the static and template files' paths and mtimes, the same in every worker"""
+    digest = hashlib.blake2b(digest_size=8)
+    for folder in (app.static_folder, app.template_folder):
+        for root, dirs, files in os.walk(os.path.join(app.root_path, folder)):
+            dirs.sort()
+            for name in sorted(files):
+                path = os.path.join(root, name)
+                digest.update(f"{os.path.relpath(path, app.root_path)}:{os.stat(path).st_mtime_ns}".encode())
+    return digest.hexdigest()
+
+# Static asset version for templates - fixed between deploys and shared by
+# every worker, so pages are byte-stable and can be revalidated with an ETag.
+# Without GIT_SHA it is derived from the files themselves rather than the
+# start time, which would differ per worker.
+APP_VERSION = os.getenv("GIT_SHA") or asset_version()
+
+@app.context_processor
+def inject_cache_buster():
+    return {'cache_buster': APP_VERSION}
+
 # Set up logging
 logging.basicConfig(level=logging.INFO if os.getenv("FLASK_ENV") == "production" else logging.DEBUG)
 logger = logging.getLogger(__name__)
 
+def fetch_dicts(cursor):
+    """fetchall() from a tuple cursor as dicts, keyed by the column names read once"""
+    columns = cursor.column_names
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+def parse_beer_details(venues):
+    """Decode the JSON_ARRAYAGG beer_details column into a list per venue"""
+    for venue in venues:
+        venue['beer_details'] = orjson.loads(venue['beer_details']) if venue['beer_details'] else []
+    return venues
+
+def take_total(rows):
+    """Strip the COUNT(*) OVER() total_results column from a page of rows and return it"""
+    total = rows[0]['total_results'] if rows else 0
+    for row in rows:
+        del row['total_results']
+    return total
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask's JSON provider with orjson doing the work. Output follows the
+    default provider - sorted keys, dates as HTTP dates, DECIMAL as strings -
+    so jsonify() responses are unchanged apart from the encoder. Bodies that
+    are cached already encoded go through encode() so every response is
+    written the same way."""
+    
+    def _options(self):
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+        return options | orjson.OPT_SORT_KEYS if self.sort_keys else options
+    
+    def encode(self, obj):
+        """Serialize obj to JSON bytes"""
+        return orjson.dumps(obj, default=self.default, option=self._options())
+    
+    def dumps(self, obj, **kwargs):
+        return self.encode(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.encode(obj), mimetype=self.mimetype)
+
+app.json = ORJSONProvider(app)
+
+# Responses that must never be cached unless the route says otherwise
+NO_STORE_PATHS = ('/admin', '/api/admin', '/api/user', '/api/get-user-id',
+                  '/api/community/my-stats', '/api/venue/', '/health')
+
 # Security headers
 @app.after_request
 def security_headers(response):
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache" 
-    response.headers["Expires"] = "0"
+    # Routes that set their own policy (see conditional_response) keep it.
+    # Otherwise only public reads may be cached - writes, errors, per-user
+    # data and venue data that a user has just edited are never stored.
+    if "Cache-Control" not in response.headers:
+        if (request.method not in ('GET', 'HEAD') or response.status_code >= 400
+                or request.path.startswith(NO_STORE_PATHS)
+                # The frontend refetches a venue through /search?venue_id= right
+                # after a report, so that lookup is venue data too
+                or (request.path == '/search' and 'venue_id' in request.args)):
+            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+            response.headers["Pragma"] = "no-cache" 
+            response.headers["Expires"] = "0"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=60"
     response.headers["X-Content-Type-Options"] = "nosniff"
     response.headers["X-Frame-Options"] = "DENY"
     response.headers["X-XSS-Protection"] = "1; mode=block"
     response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
     return response
 
-from functools import wraps
+def conditional_response(response, cache_control):
+    """Set the cache policy and an ETag, answering a matching If-None-Match with 304"""
+    response.headers["Cache-Control"] = cache_control
+    # Routes serving a cached body set its ETag already; hash the rest with
+    # a short blake2b, which is cheaper than add_etag()'s sha1
+    if response.get_etag()[0] is None:
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+    return response.make_conditional(request)
 
 # Simple admin authentication
+_ADMIN_TOKEN = os.getenv('ADMIN_TOKEN', 'beer_admin_2025').encode()
+
 def admin_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
         auth_token = request.headers.get('Authorization') or request.args.get('token')
-        expected_token = os.getenv('ADMIN_TOKEN', 'beer_admin_2025')
         
-        if not auth_token or auth_token != expected_token:
+        # Constant-time compare so response timing doesn't leak the token
+        if not auth_token or not hmac.compare_digest(auth_token.encode(), _ADMIN_TOKEN):
             return jsonify({'error': 'Admin authentication required'}), 401
         
         return f(*args, **kwargs)
@@ -119,7 +308,7 @@ def create_user():
             'missing': missing_fields
         }), 400
     
-    conn = mysql.connector.connect(**db_config)
+    conn = get_db()
     cursor = conn.cursor(dictionary=True)
     
     try:
@@ -178,7 +367,6 @@ def create_user():
         
     finally:
         cursor.close()
-        conn.close()
 
 @app.route('/api/user/signin', methods=['POST'])
 def signin_user():
@@ -197,7 +385,7 @@ def signin_user():
     if not nickname or not passcode:
         return jsonify({'error': 'Nickname and passcode required'}), 400
     
-    conn = mysql.connector.connect(**db_config)
+    conn = get_db()
     cursor = conn.cursor(dictionary=True)
     
     try:
@@ -242,7 +430,6 @@ def signin_user():
         return jsonify({'error': 'Sign in failed'}), 500
     finally:
         cursor.close()
-        conn.close()
 
 @app.route('/api/user/reset-passcode', methods=['POST'])
 def reset_passcode():
@@ -254,7 +441,7 @@ def reset_passcode():
     if not nickname or not current_passcode:
         return jsonify({'error': 'Nickname and current passcode required'}), 400
     
-    conn = mysql.connector.connect(**db_config)
+    conn = get_db()
     cursor = conn.cursor(dictionary=True)
     
     try:
@@ -292,12 +479,11 @@ def reset_passcode():
         return jsonify({'error': 'Failed to reset passcode'}), 500
     finally:
         cursor.close()
-        conn.close()
 
 @app.route('/api/user/check-device/<uuid>')
 def check_device(uuid):
     """Check if this device has an existing user"""
-    conn = mysql.connector.connect(**db_config)
+    conn = get_db()
     cursor = conn.cursor(dictionary=True)
     
     try:
@@ -325,12 +511,11 @@ def check_device(uuid):
         return jsonify({'error': 'Check failed'}), 500
     finally:
         cursor.close()
-        conn.close()
 
 @app.route('/api/user/<int:user_id>/points')
 def get_user_points(user_id):
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
         # Get points from user_stats VIEW (which sums from source tables)
@@ -350,16 +535,12 @@ def get_user_points(user_id):
     except Exception as e:
         print(f"Error getting points: {e}")
         return jsonify({'success': False, 'points': 0})
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
 
 @app.route('/api/community/my-stats/<nickname>')
 def get_user_stats(nickname):
     """Single endpoint for user stats"""
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
         cursor.execute("""
@@ -409,17 +590,13 @@ def get_user_stats(nickname):
     except Exception as e:
         logger.error(f"User stats error: {e}")
         return jsonify({'success': False}), 500
-    finally:
-        if 'conn' in locals():
-            cursor.close()
-            conn.close()
 
 @app.route('/api/community/leaderboard')
 def get_community_leaderboard():
     """Leaderboard using the same view"""
     try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor(dictionary=True)
+        conn = get_db()
+        cursor = conn.cursor()
         
         cursor.execute("""
             SELECT 
@@ -436,7 +613,7 @@ def get_community_leaderboard():
             LIMIT 20
         """)
         
-        leaderboard = cursor.fetchall()
+        leaderboard = fetch_dicts(cursor)
         
         return jsonify({
             'success': True,
@@ -446,10 +623,6 @@ def get_community_leaderboard():
     except Exception as e:
         logger.error(f"Leaderboard error: {e}")
         return jsonify({'success': False}), 500
-    finally:
-        if 'conn' in locals():
-            cursor.close()
-            conn.close()
 
 # ================================================================================
 # CORE ROUTES
@@ -458,14 +631,14 @@ def get_community_leaderboard():
 @app.route('/')
 def index():
     """Homepage"""
-    version = str(int(time.time()))
-    return render_template('index.html', cache_buster=version)
+    # Always revalidate - the shell changes on deploy - but skip the body on a match
+    return static_page('index.html', 'no-cache')
 
 @app.route('/api/get-user-id/<nickname>', methods=['GET'])
 def get_user_id(nickname):
     """Simply get user_id from nickname"""
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
         cursor.execute("""
@@ -492,57 +665,129 @@ def get_user_id(nickname):
     except Exception as e:
         logger.error(f"Error getting user ID: {str(e)}")
         return jsonify({'error': 'Failed to get user'}), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
 
-@app.route('/api/stats')
-def get_stats():
-    """Get site statistics with new schema"""
+# Site-wide counts move slowly, so they are recomputed at most every five
+# minutes (every minute for the admin dashboard). The public counts are kept
+# encoded with their ETag, so a hit is answered without touching them.
+_site_stats_cache = TTLCache(maxsize=1, ttl=300)
+_admin_stats_cache = TTLCache(maxsize=1, ttl=60)
+_stats_lock = threading.Lock()
+
+def build_site_stats():
+    """Query the public counts and cache their encoded body and ETag, or None on error"""
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor()
         
-        # Total venues
-        cursor.execute("SELECT COUNT(*) as total FROM venues")
-        total_venues = cursor.fetchone()[0]
-        
-        # Venues with GF options
-        cursor.execute("""
-            SELECT COUNT(DISTINCT venue_id) as gf_total 
-            FROM gf_status 
-            WHERE status IN ('always_tap_cask','always_bottle_can', 'currently')
-        """)
-        gf_venues = cursor.fetchone()[0]
-
-        # Venues with GF options this month
+        # Total venues (a trigger-maintained counter, migrations/012), and
+        # venues with GF options overall and this month, in one round trip -
+        # both GF counts come from a single pass over the
+        # (status, updated_at) index. gf_status holds one row per venue (the
+        # status lookups read it as a scalar), so plain counts need no dedup.
         cursor.execute("""
-            SELECT COUNT(DISTINCT venue_id) as gf_total_this_month
+            SELECT
+                (SELECT value FROM venue_counters WHERE name = 'total_venues') as total,
+                COUNT(*) as gf_total,
+                COUNT(CASE
+                    WHEN updated_at >= CURRENT_DATE() - INTERVAL (DAYOFMONTH(CURRENT_DATE()) - 1) DAY
+                    THEN 1
+                END) as gf_total_this_month
             FROM gf_status 
             WHERE status IN ('always_tap_cask','always_bottle_can', 'currently')
-            AND YEAR(updated_at) = YEAR(CURRENT_DATE())
-            AND MONTH(updated_at) = MONTH(CURRENT_DATE())
         """)
-        gf_venues_this_month = cursor.fetchone()[0]
+        total_venues, gf_venues, gf_venues_this_month = cursor.fetchone()
         
-        return jsonify({
+        body = app.json.encode({
             'total_venues': total_venues,
             'gf_venues': gf_venues,
             'gf_venues_this_month': gf_venues_this_month
         })
+        cached = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+        with _stats_lock:
+            _site_stats_cache['stats'] = cached
+        return cached
         
     except Exception as e:
         logger.error(f"Error in stats: {str(e)}")
-        return jsonify({
-            'total_venues': 67031,
-            'gf_venues': 100,
-            'gf_venues_this_month': 10 
-        })
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
+        return None
+
+@app.route('/api/stats')
+def get_stats():
+    """Get site statistics with new schema"""
+    with _stats_lock:
+        cached = _site_stats_cache.get('stats')
+    if cached is None:
+        cached = build_site_stats()
+        if cached is None:
+            return jsonify({
+                'total_venues': 67031,
+                'gf_venues': 100,
+                'gf_venues_this_month': 10 
+            })
+    
+    body, etag = cached
+    response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    return conditional_response(response, 'public, max-age=60')
+
+# Every page load asks for the latest finds, which only change when a report
+# is submitted. Encoded bodies are kept briefly per (limit, filter, page) and
+# dropped on each new report; the TTL covers the other workers.
+RECENT_FINDS_CACHE_TTL = 30
+_recent_finds_cache = TTLCache(maxsize=256, ttl=RECENT_FINDS_CACHE_TTL)
+_recent_finds_lock = threading.Lock()
+
+RECENT_FINDS_FILTERS = {
+    'all': "",
+    'today': "WHERE DATE(vb.last_seen) = CURDATE()",
+    'week': "WHERE vb.last_seen >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)",
+    'month': "WHERE vb.last_seen >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)"
+}
+
+# Built once per filter rather than formatted on every request
+RECENT_FINDS_SQL = {
+    filter_type: f"""
+        SELECT 
+            vb.report_id,
+            vb.venue_id,
+            v.venue_name,
+            v.city,
+            v.postcode,
+            vb.beer_id,
+            b.beer_name,
+            br.brewery_name,
+            vb.format,
+            vb.last_seen,
+            u.nickname as added_by,
+            u.avatar_emoji
+        FROM venue_beers vb
+        JOIN venues v ON vb.venue_id = v.venue_id
+        LEFT JOIN beers b ON vb.beer_id = b.beer_id
+        LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
+        LEFT JOIN users u ON vb.user_id = u.user_id
+        {where_clause}
+        ORDER BY vb.last_seen DESC
+        LIMIT %s OFFSET %s
+    """
+    for filter_type, where_clause in RECENT_FINDS_FILTERS.items()
+}
+
+RECENT_FINDS_STATS_SQL = {
+    filter_type: f"""
+        SELECT 
+            COUNT(DISTINCT vb.beer_id) as total_beers,
+            COUNT(DISTINCT vb.venue_id) as total_venues,
+            COUNT(DISTINCT vb.user_id) as contributors
+        FROM venue_beers vb
+        {where_clause}
+    """
+    for filter_type, where_clause in RECENT_FINDS_FILTERS.items()
+}
+
+def invalidate_recent_finds_cache():
+    """Drop the cached recent finds so the next request re-queries"""
+    with _recent_finds_lock:
+        _recent_finds_cache.clear()
 
 @app.route('/api/recent-finds')
 def get_recent_finds():
@@ -558,81 +803,49 @@ def get_recent_finds():
             limit = 100  # Cap at 100 for performance
         if page < 1:
             page = 1
+        
+        cache_key = (limit, filter_type, page)
+        with _recent_finds_lock:
+            body = _recent_finds_cache.get(cache_key)
+        if body is not None:
+            return app.response_class(body, mimetype='application/json')
             
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
-        # Build WHERE clause based on filter
-        where_clause = ""
-        if filter_type == 'today':
-            where_clause = "WHERE DATE(vb.last_seen) = CURDATE()"
-        elif filter_type == 'week':
-            where_clause = "WHERE vb.last_seen >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)"
-        elif filter_type == 'month':
-            where_clause = "WHERE vb.last_seen >= DATE_SUB(CURDATE(), INTERVAL 30 DAY)"
+        # Unknown filters list everything
+        sql_filter = filter_type if filter_type in RECENT_FINDS_FILTERS else 'all'
         
         # Get the venue_beers entries with venue and beer details
         offset = (page - 1) * limit
-        sql = f"""
-            SELECT 
-                vb.report_id,
-                vb.venue_id,
-                v.venue_name,
-                v.city,
-                v.postcode,
-                vb.beer_id,
-                b.beer_name,
-                br.brewery_name,
-                vb.format,
-                vb.last_seen,
-                u.nickname as added_by,
-                u.avatar_emoji
-            FROM venue_beers vb
-            JOIN venues v ON vb.venue_id = v.venue_id
-            LEFT JOIN beers b ON vb.beer_id = b.beer_id
-            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
-            LEFT JOIN users u ON vb.user_id = u.user_id
-            {where_clause}
-            ORDER BY vb.last_seen DESC
-            LIMIT %s OFFSET %s
-        """
-        
-        cursor.execute(sql, (limit, offset))
+        cursor.execute(RECENT_FINDS_SQL[sql_filter], (limit, offset))
         recent_finds = cursor.fetchall()
         
         # Get stats if requesting more than 2 (full view)
         stats = None
         if limit > 2:
-            stats_sql = """
-                SELECT 
-                    COUNT(DISTINCT vb.beer_id) as total_beers,
-                    COUNT(DISTINCT vb.venue_id) as total_venues,
-                    COUNT(DISTINCT vb.user_id) as contributors
-                FROM venue_beers vb
-            """
-            if where_clause:
-                stats_sql += " " + where_clause
-                
-            cursor.execute(stats_sql)
+            cursor.execute(RECENT_FINDS_STATS_SQL[sql_filter])
             stats = cursor.fetchone()
         
-        # Format the response
+        # Format the response - last_seen is a DATE, so whole days against
+        # one reading of today
+        today = datetime.now().date()
         formatted_finds = []
         for find in recent_finds:
             # Calculate time ago using last_seen
-            time_diff = datetime.now().date() - find['last_seen']
+            days = (today - find['last_seen']).days
             
-            if time_diff.days == 0:
+            if days == 0:
                 time_ago = "Today"
-            elif time_diff.days == 1:
+            elif days == 1:
                 time_ago = "Yesterday"
-            elif time_diff.days < 7:
-                time_ago = f"{time_diff.days} days ago"
-            elif time_diff.days < 30:
-                weeks = time_diff.days // 7
+            elif days < 7:
+                time_ago = f"{days} days ago"
+            elif days < 30:
+                weeks = days // 7
                 time_ago = f"{weeks} week{'s' if weeks > 1 else ''} ago"
             else:
-                months = time_diff.days // 30
+                months = days // 30
                 time_ago = f"{months} month{'s' if months > 1 else ''} ago"
             
             # Format beer info
@@ -673,8 +886,11 @@ def get_recent_finds():
         # Add stats if available
         if stats:
             response_data['stats'] = stats
-            
-        return jsonify(response_data)
+        
+        body = app.json.encode(response_data)
+        with _recent_finds_lock:
+            _recent_finds_cache[cache_key] = body
+        return app.response_class(body, mimetype='application/json')
         
     except mysql.connector.Error as e:
         logger.error(f"Database error in recent finds: {str(e)}")
@@ -689,54 +905,46 @@ def get_recent_finds():
             'success': False,
             'error': 'An error occurred'
         }), 500
-        
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
+
+# Reports are counted per beer before beers and breweries are joined, so the
+# join and the sort see one row per beer rather than one per report
+TRENDING_SQL = """
+    SELECT 
+        CONCAT(br.brewery_name, ' - ', b.beer_name) as beer_name,
+        br.brewery_name,
+        b.beer_name as name_only,
+        t.report_count,
+        t.venue_count
+    FROM (
+        SELECT vb.beer_id,
+               COUNT(*) as report_count,
+               COUNT(DISTINCT vb.venue_id) as venue_count
+        FROM venue_beers vb{where}
+        GROUP BY vb.beer_id
+    ) t
+    JOIN beers b ON t.beer_id = b.beer_id
+    JOIN breweries br ON b.brewery_id = br.brewery_id
+    ORDER BY t.report_count DESC
+    LIMIT {limit}
+"""
+
 @app.route('/api/community/trending')
 def get_trending_beers():
     """Get trending beers from the last 7 days, fallback to all-time if none"""
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
         # First try: beers reported in the last 7 days
-        cursor.execute("""
-            SELECT 
-                CONCAT(br.brewery_name, ' - ', b.beer_name) as beer_name,
-                br.brewery_name,
-                b.beer_name as name_only,
-                COUNT(*) as report_count,
-                COUNT(DISTINCT vb.venue_id) as venue_count
-            FROM venue_beers vb
-            JOIN beers b ON vb.beer_id = b.beer_id
-            JOIN breweries br ON b.brewery_id = br.brewery_id
-            WHERE vb.last_seen >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)
-            GROUP BY b.beer_id, br.brewery_id
-            ORDER BY report_count DESC
-            LIMIT 3
-        """)
+        cursor.execute(TRENDING_SQL.format(
+            where=" WHERE vb.last_seen >= DATE_SUB(CURDATE(), INTERVAL 7 DAY)", limit=3))
         
         trending = cursor.fetchall()
         time_period = 'this_week'
         
         # If no results this week, get all-time top 5
         if not trending or len(trending) == 0:
-            cursor.execute("""
-                SELECT 
-                    CONCAT(br.brewery_name, ' - ', b.beer_name) as beer_name,
-                    br.brewery_name,
-                    b.beer_name as name_only,
-                    COUNT(*) as report_count,
-                    COUNT(DISTINCT vb.venue_id) as venue_count
-                FROM venue_beers vb
-                JOIN beers b ON vb.beer_id = b.beer_id
-                JOIN breweries br ON b.brewery_id = br.brewery_id
-                GROUP BY b.beer_id, br.brewery_id
-                ORDER BY report_count DESC
-                LIMIT 5
-            """)
+            cursor.execute(TRENDING_SQL.format(where='', limit=5))
             
             trending = cursor.fetchall()
             time_period = 'all_time'
@@ -766,10 +974,325 @@ def get_trending_beers():
             'success': False,
             'error': str(e)
         }), 500
+
+# ================================================================================
+# SEARCH SQL TEMPLATES
+# ================================================================================
+
+# Built once at import so each (search_type, gf_only) variant is formatted
+# once rather than on every request.
+# gf_status joins on venue_id are covered by idx_gf_status_venue_status
+# (migrations/004_autocomplete_ordering_indexes.sql)
+GF_ONLY_FILTER = " AND s.status IN ('always_tap_cask', 'always_bottle_can', 'currently')"
+
+# The autocomplete, search and nearby statements read the venues_search read
+# model (migrations/005_venues_search.sql), where the status is a column
+READ_MODEL_GF_FILTER = " AND v.gf_status IN ('always_tap_cask', 'always_bottle_can', 'currently')"
+
+# Autocomplete runs on every keystroke, so each condition has to be able to
+# use an index: FULLTEXT word prefixes for names and free text, anchored LIKE
+# for postcodes and towns.
+AUTOCOMPLETE_CONDITIONS = {
+    'name': "MATCH(v.venue_name) AGAINST (%s IN BOOLEAN MODE)",
+    'postcode': "v.postcode LIKE %s",
+    'area': "v.city LIKE %s",
+    'all': "MATCH(v.venue_name, v.postcode, v.city, v.address) AGAINST (%s IN BOOLEAN MODE)",
+    # Queries with no indexed word left for FULLTEXT ("S2", "Ye", "The") -
+    # an anchored LIKE walks idx_vs_name_id already in name order and stops
+    # at the LIMIT. One parameter per column.
+    'name_prefix': "v.venue_name LIKE %s",
+    'all_prefix': "(v.venue_name LIKE %s OR v.postcode LIKE %s OR v.city LIKE %s)"
+}
+
+AUTOCOMPLETE_SQL = {
+    (search_type, gf_only): f"""
+        SELECT v.venue_id, v.venue_name, 
+               v.address, 
+               v.postcode
+        FROM venues_search v
+        WHERE {condition}{READ_MODEL_GF_FILTER if gf_only else ''}
+        ORDER BY v.venue_name
+        LIMIT %s
+    """
+    for search_type, condition in AUTOCOMPLETE_CONDITIONS.items()
+    for gf_only in (False, True)
+}
+
+# Great-circle distance in km from a point, bound as distance_params(lat, lng)
+# so the trig on the point itself is done once in Python rather than per row.
+# Rounding can push the cosine just past 1 for a venue at the exact point
+# given, which makes acos() NULL and silently drops the venue, so it is clamped.
+DISTANCE_KM_SQL = """(6371 * acos(LEAST(1, %s * cos(radians(v.latitude)) * 
+            cos(radians(v.longitude) - %s) + %s * 
+            sin(radians(v.latitude)))))"""
+
+def distance_params(lat, lng):
+    """Return the (cos lat, lng in radians, sin lat) parameters DISTANCE_KM_SQL takes"""
+    lat_r = math.radians(lat)
+    return math.cos(lat_r), math.radians(lng), math.sin(lat_r)
+
+# Geocoded postcode searches cover this radius around the postcode centroid
+POSTCODE_RADIUS_KM = 5
+
+def bounding_box(lat, lng, radius_km):
+    """Return (min_lat, max_lat, min_lng, max_lng) enclosing radius_km around a point"""
+    dlat = radius_km / 111.0
+    dlng = radius_km / (111.0 * max(math.cos(math.radians(lat)), 0.01))
+    return lat - dlat, lat + dlat, lng - dlng, lng + dlng
+
+# Same index-friendly forms as autocomplete - the FULLTEXT and BTREE indexes
+# are case-insensitive through the column collation, so no lowered copies
+SEARCH_CONDITIONS = {
+    'name': "MATCH(v.venue_name) AGAINST (%s IN BOOLEAN MODE)",
+    'postcode': "v.postcode LIKE %s",
+    # Geocoded postcode - everything within POSTCODE_RADIUS_KM of the centroid.
+    # The bounding box lets idx_vs_lat_lng narrow the rows before the exact
+    # distance trims the corners.
+    'postcode_radius': f"""v.latitude BETWEEN %s AND %s AND v.longitude BETWEEN %s AND %s
+        AND {DISTANCE_KM_SQL} <= {POSTCODE_RADIUS_KM}""",
+    'area': "v.city LIKE %s",
+    'all': "MATCH(v.venue_name, v.postcode, v.city, v.address) AGAINST (%s IN BOOLEAN MODE)",
+    'name_prefix': "v.venue_name LIKE %s",
+    'all_prefix': "(v.venue_name LIKE %s OR v.postcode LIKE %s OR v.city LIKE %s)"
+}
+
+# The venue columns every venue list returns - search, nearby, beer search
+# and the single-venue lookup all select these first
+VENUE_COLUMNS = """
+            v.venue_id,
+            v.venue_name,
+            v.address,
+            v.postcode,
+            v.city,
+            v.city AS local_authority,
+            v.latitude,
+            v.longitude"""
+
+# One page of results, ordered by distance from the user when their location
+# is known and by name otherwise. Rows arrive in the response's shape -
+# local_authority aliased, distance rounded, 999 (sorted last) for venues
+# without coordinates - so they are encoded as fetched. Beers come from the read model, which copies
+# the trigger-maintained venues.beer_details_cache column;
+# ?include_beers=fresh reads them from venue_beers via attach_beer_details.
+SEARCH_SQL = {
+    (search_type, gf_only, by_distance): f"""
+        SELECT{VENUE_COLUMNS},
+            v.gf_status,
+            v.beer_details{f', COALESCE(ROUND({DISTANCE_KM_SQL}, 2), 999) AS distance' if by_distance else ''}
+        FROM venues_search v
+        WHERE {condition}{READ_MODEL_GF_FILTER if gf_only else ''}
+        ORDER BY {'v.latitude IS NULL, distance' if by_distance else 'v.venue_name'}, v.venue_id
+        LIMIT %s OFFSET %s
+    """
+    for search_type, condition in SEARCH_CONDITIONS.items()
+    for gf_only in (False, True)
+    for by_distance in (False, True)
+}
+
+SEARCH_COUNT_SQL = {
+    (search_type, gf_only): f"""
+        SELECT COUNT(*) AS total
+        FROM venues_search v
+        WHERE {condition}{READ_MODEL_GF_FILTER if gf_only else ''}
+    """
+    for search_type, condition in SEARCH_CONDITIONS.items()
+    for gf_only in (False, True)
+}
+
+# Totals for result sets bigger than a page, reused while paging through them
+_search_count_cache = TTLCache(maxsize=2048, ttl=120)
+_search_count_lock = threading.Lock()
+
+VENUE_SQL = {
+    gf_only: f"""
+        SELECT{VENUE_COLUMNS},
+            COALESCE(s.status, 'unknown') as gf_status
+        FROM venues v
+        LEFT JOIN gf_status s ON v.venue_id = s.venue_id
+        WHERE v.venue_id = %s{GF_ONLY_FILTER if gf_only else ''}
+    """
+    for gf_only in (False, True)
+}
+
+def attach_beer_details(conn, venues, condition=None, params=()):
+    """Fetch the beers for a page of venues in one query and attach them as beer_details,
+    optionally only those matching an extra condition on vb/b/br"""
+    beers_by_venue = {venue['venue_id']: [] for venue in venues}
+    
+    if beers_by_venue:
+        placeholders = ', '.join(['%s'] * len(beers_by_venue))
+        cursor = conn.cursor()
+        cursor.execute(f"""
+            SELECT vb.venue_id, vb.format,
+                   COALESCE(br.brewery_name, 'Unknown') as brewery,
+                   COALESCE(b.beer_name, 'Unknown') as name,
+                   COALESCE(b.style, 'Unknown') as style
+            FROM venue_beers vb
+            LEFT JOIN beers b ON vb.beer_id = b.beer_id
+            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
+            WHERE vb.venue_id IN ({placeholders}){f' AND {condition}' if condition else ''}
+        """, list(beers_by_venue) + list(params))
+        for venue_id, beer_format, brewery, name, style in cursor.fetchall():
+            beers_by_venue[venue_id].append(
+                {'format': beer_format, 'brewery': brewery, 'name': name, 'style': style})
+        cursor.close()
+    
+    for venue in venues:
+        venue['beer_details'] = beers_by_venue[venue['venue_id']]
+    return venues
+
+# /nearby filters on the spatial index of venues_search.geom
+# (migrations/011_venues_search_geom.sql): MBRContains() on the bounding box
+# is an R-tree lookup, and the spherical distance from POINT(%s lng, %s lat)
+# trims the corners
+NEARBY_DISTANCE_KM_SQL = "ST_Distance_Sphere(v.geom, POINT(%s, %s), 6371000) / 1000"
+
+NEARBY_SQL = {
+    gf_only: f"""
+        SELECT{VENUE_COLUMNS},
+            v.gf_status,
+            v.beer_details,
+            ROUND({NEARBY_DISTANCE_KM_SQL}, 2) AS distance,
+            COUNT(*) OVER() AS total_results
+        FROM venues_search v
+        WHERE MBRContains(ST_MakeEnvelope(POINT(%s, %s), POINT(%s, %s)), v.geom)
+        AND v.latitude IS NOT NULL
+        AND {NEARBY_DISTANCE_KM_SQL} <= %s{READ_MODEL_GF_FILTER if gf_only else ''}
+        ORDER BY distance
+        LIMIT %s OFFSET %s
+    """
+    for gf_only in (False, True)
+}
+
+# Users looking around the same area send near-identical coordinates, so
+# /nearby snaps the point to NEARBY_PRECISION decimal places (about 110 m)
+# and keeps encoded pages for a minute. Dropped whenever venues_search rows
+# are rewritten; the TTL covers the other workers.
+NEARBY_PRECISION = 3
+_nearby_cache = TTLCache(maxsize=2000, ttl=60)
+_nearby_lock = threading.Lock()
+
+def invalidate_nearby_cache():
+    """Drop the cached /nearby pages so the next request re-queries"""
+    with _nearby_lock:
+        _nearby_cache.clear()
+
+# ================================================================================
+# VENUE SEARCH READ MODEL
+# ================================================================================
+
+# Rows are rewritten straight after each venue/status/beer write, and every
+# few minutes one worker rewrites the rows for venues changed since its last
+# run to catch anything changed elsewhere (migrations/015)
+VENUES_SEARCH_REFRESH_SECONDS = int(os.getenv('VENUES_SEARCH_REFRESH_SECONDS', 300))
+
+VENUES_SEARCH_REFRESH_SQL = """
+    REPLACE INTO venues_search
+        (venue_id, venue_name, address, postcode, city, latitude, longitude, gf_status, beer_details)
+    SELECT
+        v.venue_id,
+        v.venue_name,
+        v.address,
+        v.postcode,
+        v.city,
+        v.latitude,
+        v.longitude,
+        COALESCE(s.status, 'unknown'),
+        v.beer_details_cache
+    FROM venues v
+    LEFT JOIN gf_status s ON v.venue_id = s.venue_id
+"""
+
+# Venues whose row or GF status changed since a point in time, each side
+# read from its updated_at index
+VENUES_SEARCH_CHANGED_SQL = VENUES_SEARCH_REFRESH_SQL + """
+    WHERE v.venue_id IN (
+        SELECT venue_id FROM venues WHERE updated_at >= %s
+        UNION
+        SELECT venue_id FROM gf_status WHERE updated_at >= %s
+    )
+"""
+
+# The last periodic run, shared by every worker - due stays false while
+# another worker's run is still within the interval
+VENUES_SEARCH_LAST_REFRESH_SQL = """
+    SELECT refreshed_at, NOW(), refreshed_at <= NOW() - INTERVAL %s SECOND AS due
+    FROM venues_search_refresh
+    WHERE name = 'venues_search'
+"""
+
+def refresh_venues_search(conn, venue_ids):
+    """Rewrite the read-model rows for venue_ids"""
+    try:
+        cursor = conn.cursor()
+        placeholders = ', '.join(['%s'] * len(venue_ids))
+        cursor.execute(VENUES_SEARCH_REFRESH_SQL + f" WHERE v.venue_id IN ({placeholders})", list(venue_ids))
+        conn.commit()
+        cursor.close()
+        invalidate_nearby_cache()
+    except mysql.connector.Error as e:
+        # The write itself has already been committed - a stale row is
+        # picked up by the next periodic refresh
+        logger.error(f"Error refreshing venues_search: {str(e)}")
+        conn.rollback()
+
+def refresh_changed_venues_search(conn):
+    """Rewrite the rows for venues changed since the last periodic run, unless another worker ran within the interval"""
+    cursor = conn.cursor()
+    try:
+        cursor.execute(VENUES_SEARCH_LAST_REFRESH_SQL, (VENUES_SEARCH_REFRESH_SECONDS,))
+        last_refresh, started, due = cursor.fetchone()
+        if not due:
+            return
+        
+        # Rows changed while this runs are newer than started and are
+        # caught next time
+        cursor.execute(VENUES_SEARCH_CHANGED_SQL, (last_refresh, last_refresh))
+        changed = cursor.rowcount
+        # Deleted venues leave no updated_at behind
+        cursor.execute("""
+            DELETE vs FROM venues_search vs
+            LEFT JOIN venues v ON v.venue_id = vs.venue_id
+            WHERE v.venue_id IS NULL
+        """)
+        changed += cursor.rowcount
+        cursor.execute(
+            "UPDATE venues_search_refresh SET refreshed_at = %s WHERE name = 'venues_search'",
+            (started,))
+        conn.commit()
+    except mysql.connector.Error:
+        conn.rollback()
+        raise
     finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
+        cursor.close()
+    
+    if changed:
+        invalidate_nearby_cache()
+
+def venues_search_refresh_loop():
+    """Periodic incremental refresh; GET_LOCK keeps workers from refreshing at the same time"""
+    while True:
+        time.sleep(VENUES_SEARCH_REFRESH_SECONDS)
+        try:
+            conn = get_db_pool().get_connection()
+            try:
+                cursor = conn.cursor()
+                cursor.execute("SELECT GET_LOCK('venues_search_refresh', 0)")
+                if cursor.fetchone()[0] == 1:
+                    try:
+                        refresh_changed_venues_search(conn)
+                    finally:
+                        cursor.execute("DO RELEASE_LOCK('venues_search_refresh')")
+                cursor.close()
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Error refreshing venues_search: {str(e)}")
+
+def start_venues_search_refresh():
+    """Start the periodic refresh - from each gunicorn worker (gunicorn.conf.py) and the dev server, not on import"""
+    if VENUES_SEARCH_REFRESH_SECONDS > 0:
+        threading.Thread(target=venues_search_refresh_loop, name='venues-search-refresh', daemon=True).start()
 
 @app.route('/nearby')
 def nearby():
@@ -779,8 +1302,10 @@ def nearby():
     radius = request.args.get('radius', 5, type=int)
     gf_only = request.args.get('gf_only', 'false').lower() == 'true'
     page = request.args.get('page', 1, type=int)
+    fresh_beers = request.args.get('include_beers') == 'fresh'
     
-    if not lat or not lng:
+    # 0.0 is a real coordinate - the Greenwich meridian runs through England
+    if lat is None or lng is None:
         return jsonify({'error': 'Latitude and longitude required'}), 400
     
     if not (-90 <= lat <= 90) or not (-180 <= lng <= 180):
@@ -788,86 +1313,43 @@ def nearby():
     
     if not (1 <= radius <= 50):
         return jsonify({'error': 'Invalid radius'}), 400
+    
+    if page < 1 or page > 1000:
+        return jsonify({'error': 'Invalid page number'}), 400
+
+    lat = round(lat, NEARBY_PRECISION)
+    lng = round(lng, NEARBY_PRECISION)
+    # Fresh beers bypass the cache - they are asked for to see the latest
+    cache_key = None if fresh_beers else (lat, lng, radius, gf_only, page)
+    if cache_key:
+        with _nearby_lock:
+            body = _nearby_cache.get(cache_key)
+        if body is not None:
+            return app.response_class(body, mimetype='application/json')
 
     try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor(dictionary=True)
-        
-        # First get total count
-        count_sql = """
-            SELECT COUNT(DISTINCT v.venue_id) as total
-            FROM venues v
-            LEFT JOIN gf_status s ON v.venue_id = s.venue_id
-            WHERE v.latitude IS NOT NULL AND v.longitude IS NOT NULL
-            AND (6371 * acos(cos(radians(%s)) * cos(radians(v.latitude)) * 
-                cos(radians(v.longitude) - radians(%s)) + sin(radians(%s)) * 
-                sin(radians(v.latitude)))) <= %s
-        """
-        
-        count_params = [lat, lng, lat, radius]
-        
-        if gf_only:
-            count_sql += " AND s.status IN ('always_tap_cask','always_bottle_can', 'currently')"
-        
-        cursor.execute(count_sql, count_params)
-        total_count = cursor.fetchone()['total']
+        conn = get_db()
+        cursor = conn.cursor()
         
-        # Now get paginated results
+        # Paginated results - total comes back on every row via COUNT(*) OVER()
         per_page = 20
         offset = (page - 1) * per_page
         
-        sql = """
-            SELECT DISTINCT
-                v.venue_id,
-                v.venue_name,
-                v.address,
-                v.postcode,
-                v.city,
-                v.latitude,
-                v.longitude,
-                ANY_VALUE(COALESCE(s.status, 'unknown')) as gf_status,
-                (6371 * acos(cos(radians(%s)) * cos(radians(v.latitude)) * 
-                    cos(radians(v.longitude) - radians(%s)) + sin(radians(%s)) * 
-                    sin(radians(v.latitude)))) AS distance,
-                GROUP_CONCAT(
-                    DISTINCT CONCAT(vb.format, ' - ', 
-                    COALESCE(br.brewery_name, 'Unknown'), ' ', 
-                    COALESCE(b.beer_name, 'Unknown'), ' (', 
-                    COALESCE(b.style, 'Unknown'), ')')
-                    SEPARATOR ', '
-                ) as beer_details
-            FROM venues v
-            LEFT JOIN gf_status s ON v.venue_id = s.venue_id
-            LEFT JOIN venue_beers vb ON v.venue_id = vb.venue_id
-            LEFT JOIN beers b ON vb.beer_id = b.beer_id
-            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
-            WHERE v.latitude IS NOT NULL AND v.longitude IS NOT NULL
-        """
-        
-        params = [lat, lng, lat]
-        
-        if gf_only:
-            sql += " AND s.status IN ('always_tap_cask','always_bottle_can', 'currently')"
-        
-        sql += """
-            GROUP BY v.venue_id
-            HAVING distance <= %s
-            ORDER BY distance
-            LIMIT %s OFFSET %s
-        """
-        params.extend([radius, per_page, offset])
-        
-        cursor.execute(sql, params)
-        venues = cursor.fetchall()
+        # Bounding box around the radius for the spatial index; the exact
+        # distance in NEARBY_SQL trims the corners
+        min_lat, max_lat, min_lng, max_lng = bounding_box(lat, lng, radius)
+        params = (lng, lat, min_lng, min_lat, max_lng, max_lat, lng, lat, radius,
+                  per_page, offset)
         
-        # Add local_authority field for frontend compatibility
-        for venue in venues:
-            venue['local_authority'] = venue['city']
-            # Round distance for display
-            if venue['distance']:
-                venue['distance'] = round(venue['distance'], 2)
+        cursor.execute(NEARBY_SQL[gf_only], params)
+        venues = fetch_dicts(cursor)
+        if fresh_beers:
+            attach_beer_details(conn, venues)
+        else:
+            parse_beer_details(venues)
+        total_count = take_total(venues)
         
-        return jsonify({
+        body = app.json.encode({
             'venues': venues,
             'pagination': {
                 'page': page,
@@ -877,14 +1359,14 @@ def nearby():
                 'has_next': page * per_page < total_count
             }
         })
+        if cache_key:
+            with _nearby_lock:
+                _nearby_cache[cache_key] = body
+        return app.response_class(body, mimetype='application/json')
         
     except mysql.connector.Error as e:
         logger.error(f"Database error in nearby search: {str(e)}")
         return jsonify({'error': f'Database error: {str(e)}'}), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
 
 @app.route('/search')
 def search():
@@ -894,6 +1376,7 @@ def search():
     gf_only = request.args.get('gf_only', 'false').lower() == 'true'
     page = request.args.get('page', 1, type=int)
     venue_id = request.args.get('venue_id', type=int)
+    fresh_beers = request.args.get('include_beers') == 'fresh'
     country = request.args.get('country', 'GB')
     
     # Get user location for distance ordering
@@ -914,52 +1397,29 @@ def search():
         return jsonify({'error': 'Invalid page number'}), 400
 
     try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor(dictionary=True)
+        conn = get_db()
+        cursor = conn.cursor()
         
         # Handle specific venue ID search
         if venue_id:
-            sql = """
-                SELECT DISTINCT
-                    v.venue_id,
-                    v.venue_name,
-                    v.address,
-                    v.postcode,
-                    v.city,
-                    v.latitude,
-                    v.longitude,
-                    ANY_VALUE(COALESCE(s.status, 'unknown')) as gf_status,
-                    GROUP_CONCAT(
-                        DISTINCT CONCAT(vb.format, ' - ', 
-                        COALESCE(br.brewery_name, 'Unknown'), ' ', 
-                        COALESCE(b.beer_name, 'Unknown'), ' (', 
-                        COALESCE(b.style, 'Unknown'), ')')
-                        SEPARATOR ', '
-                    ) as beer_details
-                FROM venues v
-                LEFT JOIN gf_status s ON v.venue_id = s.venue_id
-                LEFT JOIN venue_beers vb ON v.venue_id = vb.venue_id
-                LEFT JOIN beers b ON vb.beer_id = b.beer_id
-                LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
-                WHERE v.venue_id = %s
-            """
-            
-            if gf_only:
-                sql += " AND s.status IN ('always_tap_cask', 'always_bottle_can', 'currently')"
-            
-            sql += " GROUP BY v.venue_id"
-            cursor.execute(sql, (venue_id,))
-            venues = cursor.fetchall()
+            cursor.execute(VENUE_SQL[gf_only], (venue_id,))
+            venues = attach_beer_details(conn, fetch_dicts(cursor))
             return jsonify(venues)
         
         # Regular search logic
         if not query:
             return jsonify({'error': 'Query is required for search'}), 400
         
-        # Build search condition
+        # Pick the prebuilt search condition
+        postcode_origin = None
         if search_type == 'name':
-            search_condition = "v.venue_name LIKE %s"
-            search_params = [f'%{query}%']
+            fulltext_query = fulltext_prefix_query(query)
+            if fulltext_query:
+                condition_key = 'name'
+                search_params = [fulltext_query]
+            else:
+                condition_key = 'name_prefix'
+                search_params = [f'{query}%']
         elif search_type == 'postcode':
             clean_postcode = query.upper().strip()
             
@@ -970,15 +1430,13 @@ def search():
             # Only do prefix search for very short codes (S2, LS2)
             if len(clean_postcode) <= 4 and ' ' not in clean_postcode:
                 # This is probably an area code - do prefix search
-                search_condition = "v.postcode LIKE %s"
+                condition_key = 'postcode'
                 search_params = [f'{clean_postcode}%']
             else:
                 # This looks like a real postcode - geocode it!
-                # Import at top: from app import geocodePostcode or requests
                 try:
-                    # Use Nominatim or postcodes.io to get coordinates
-                    import requests
-                    response = requests.get(f'https://api.postcodes.io/postcodes/{clean_postcode}')
+                    # Use postcodes.io to get coordinates
+                    response = _http.get(f'https://api.postcodes.io/postcodes/{clean_postcode}', timeout=5)
                     if response.ok:
                         data = response.json()
                         lat = data['result']['latitude']
@@ -986,108 +1444,67 @@ def search():
                         
                         # Now search within 5km of these coordinates
                         # This is the ACTUAL nearby search they want!
-                        search_condition = """
-                            (6371 * acos(cos(radians(%s)) * cos(radians(v.latitude)) * 
-                            cos(radians(v.longitude) - radians(%s)) + sin(radians(%s)) * 
-                            sin(radians(v.latitude)))) <= 5
-                        """
-                        search_params = [lat, lon, lat]
+                        condition_key = 'postcode_radius'
+                        search_params = [*bounding_box(lat, lon, POSTCODE_RADIUS_KM), *distance_params(lat, lon)]
+                        postcode_origin = (lat, lon)
                     else:
                         # Fallback to prefix if geocoding fails
-                        search_condition = "v.postcode LIKE %s"
+                        condition_key = 'postcode'
                         search_params = [f'{clean_postcode}%']
                 except:
                     # Fallback
-                    search_condition = "v.postcode LIKE %s"
+                    condition_key = 'postcode'
                     search_params = [f'{clean_postcode}%']
         elif search_type == 'area':
-            search_condition = "v.city LIKE %s"
-            search_params = [f'%{query}%']
+            condition_key = 'area'
+            search_params = [f'{query}%']
         else:
-            search_condition = "(v.venue_name LIKE %s OR v.postcode LIKE %s OR v.city LIKE %s OR v.address LIKE %s)"
-            search_params = [f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%']
-        
-        # Get ALL matching results first (no pagination yet)
-        sql = f"""
-            SELECT DISTINCT
-                v.venue_id,
-                v.venue_name,
-                v.address,
-                v.postcode,
-                v.city,
-                v.latitude,
-                v.longitude,
-                ANY_VALUE(COALESCE(s.status, 'unknown')) as gf_status,
-                GROUP_CONCAT(
-                    DISTINCT CONCAT(vb.format, ' - ', 
-                    COALESCE(br.brewery_name, 'Unknown'), ' ', 
-                    COALESCE(b.beer_name, 'Unknown'), ' (', 
-                    COALESCE(b.style, 'Unknown'), ')')
-                    SEPARATOR ', '
-                ) as beer_details
-            FROM venues v
-            LEFT JOIN gf_status s ON v.venue_id = s.venue_id
-            LEFT JOIN venue_beers vb ON v.venue_id = vb.venue_id
-            LEFT JOIN beers b ON vb.beer_id = b.beer_id
-            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
-            WHERE {search_condition}
-        """
-        
-        params = search_params.copy()
-        
-        if gf_only:
-            sql += " AND s.status IN ('always_tap_cask', 'always_bottle_can', 'currently')"
-        
-        sql += " GROUP BY v.venue_id"
-        
-        cursor.execute(sql, params)
-        all_venues = cursor.fetchall()
-        
-        # Add local_authority field for frontend compatibility
-        for venue in all_venues:
-            venue['local_authority'] = venue['city']
+            fulltext_query = fulltext_prefix_query(query)
+            if fulltext_query:
+                condition_key = 'all'
+                search_params = [fulltext_query]
+            else:
+                condition_key = 'all_prefix'
+                search_params = [f'{query}%'] * 3
         
-        # Sort by distance if user location provided
+        # Sorting and paging happen in MySQL; one extra row tells us whether
+        # there is a next page
+        per_page = 20
+        offset = (page - 1) * per_page
+        # Nearest the user first; a geocoded postcode search without the
+        # user's location ranks by distance from the postcode instead
         if user_lat is not None and user_lng is not None:
-            # Calculate distance for each venue and sort
-            for venue in all_venues:
-                if venue['latitude'] and venue['longitude']:
-                    # FIXED Haversine formula
-                    lat1 = math.radians(user_lat)
-                    lon1 = math.radians(user_lng)
-                    lat2 = math.radians(float(venue['latitude']))
-                    lon2 = math.radians(float(venue['longitude']))
-            
-                    dlat = lat2 - lat1
-                    dlon = lon2 - lon1
-            
-                    a = (math.sin(dlat/2)**2 + 
-                 math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2)
-                    c = 2 * math.asin(math.sqrt(a))
-            
-                    # Radius of earth in kilometers
-                    r = 6371
-                    distance = c * r
-            
-                    venue['distance'] = round(distance, 2)
-                else:
-                    venue['distance'] = 999  # Put venues without coordinates at the end
-    
-            # Sort by distance
-            all_venues.sort(key=lambda x: x.get('distance', 999))
+            origin = (user_lat, user_lng)
         else:
-            # Sort alphabetically if no location
-            all_venues.sort(key=lambda x: x['venue_name'])
-        
-        # Calculate pagination
-        total_results = len(all_venues)
-        per_page = 20
+            origin = postcode_origin
+        by_distance = origin is not None
+        origin_params = list(distance_params(*origin)) if by_distance else []
+        
+        cursor.execute(SEARCH_SQL[(condition_key, gf_only, by_distance)],
+                       origin_params + search_params + [per_page + 1, offset])
+        venues = fetch_dicts(cursor)
+        has_next = len(venues) > per_page
+        venues = venues[:per_page]
+        
+        # A first page that holds everything is its own total; otherwise
+        # count once and keep it for the following pages
+        if page == 1 and not has_next:
+            total_results = len(venues)
+        else:
+            count_key = (condition_key, gf_only, tuple(search_params))
+            with _search_count_lock:
+                total_results = _search_count_cache.get(count_key)
+            if total_results is None:
+                cursor.execute(SEARCH_COUNT_SQL[(condition_key, gf_only)], search_params)
+                total_results = cursor.fetchone()[0]
+                with _search_count_lock:
+                    _search_count_cache[count_key] = total_results
         total_pages = (total_results + per_page - 1) // per_page
         
-        # Apply pagination to sorted results
-        start_idx = (page - 1) * per_page
-        end_idx = start_idx + per_page
-        venues = all_venues[start_idx:end_idx]
+        if fresh_beers:
+            attach_beer_details(conn, venues)
+        else:
+            parse_beer_details(venues)
         
         # Return with pagination info
         return jsonify({
@@ -1097,17 +1514,59 @@ def search():
                 'pages': total_pages,
                 'total': total_results,
                 'has_prev': page > 1,
-                'has_next': page < total_pages
+                'has_next': has_next
             }
         })
         
     except mysql.connector.Error as e:
         logger.error(f"Database error in search: {str(e)}")
         return jsonify({'error': 'Database error occurred'}), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
+
+# Word-prefix FULLTEXT matches (ft_beer_name from migrations/009, the brewery
+# name and style indexes from migrations/014); an anchored LIKE on the same
+# columns when the query has no indexed word. One parameter per column in
+# each condition.
+BEER_SEARCH_CONDITIONS = {
+    'brewery': "MATCH(br.brewery_name) AGAINST (%s IN BOOLEAN MODE)",
+    'beer': "MATCH(b.beer_name) AGAINST (%s IN BOOLEAN MODE)",
+    'style': "MATCH(b.style) AGAINST (%s IN BOOLEAN MODE)",
+    'all': """(MATCH(br.brewery_name) AGAINST (%s IN BOOLEAN MODE)
+                OR MATCH(b.beer_name) AGAINST (%s IN BOOLEAN MODE)
+                OR MATCH(b.style) AGAINST (%s IN BOOLEAN MODE))"""
+}
+
+BEER_SEARCH_PREFIX_CONDITIONS = {
+    'brewery': "br.brewery_name LIKE %s",
+    'beer': "b.beer_name LIKE %s",
+    'style': "b.style LIKE %s",
+    'all': "(br.brewery_name LIKE %s OR b.beer_name LIKE %s OR b.style LIKE %s)"
+}
+
+# Venues with at least one matching beer, one page at a time. The semi-join
+# reads each venue once instead of grouping the venue x beer fan-out; the
+# matching beers for the page are fetched afterwards by attach_beer_details.
+BEER_SEARCH_SQL = {
+    (search_type, gf_only, prefix): f"""
+        SELECT{VENUE_COLUMNS},
+            v.country,
+            COALESCE(s.status, 'unknown') as gf_status,
+            COUNT(*) OVER() AS total_results
+        FROM venues v
+        LEFT JOIN gf_status s ON v.venue_id = s.venue_id
+        WHERE v.venue_id IN (
+            SELECT vb.venue_id
+            FROM venue_beers vb
+            LEFT JOIN beers b ON vb.beer_id = b.beer_id
+            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
+            WHERE {condition}
+        ){GF_ONLY_FILTER if gf_only else ''}
+        ORDER BY v.venue_name, v.venue_id
+        LIMIT %s OFFSET %s
+    """
+    for prefix, conditions in ((False, BEER_SEARCH_CONDITIONS), (True, BEER_SEARCH_PREFIX_CONDITIONS))
+    for search_type, condition in conditions.items()
+    for gf_only in (False, True)
+}
 
 @app.route('/api/search-by-beer')
 def search_by_beer():
@@ -1121,82 +1580,29 @@ def search_by_beer():
     if not query or len(query) < 2:
         return jsonify({'error': 'Query too short'}), 400
     
+    if search_type not in BEER_SEARCH_CONDITIONS:
+        search_type = 'all'
+    
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
-        # Build the WHERE clause based on search type
-        if search_type == 'brewery':
-            where_clause = "br.brewery_name LIKE %s"
-            search_param = f'%{query}%'
-        elif search_type == 'beer':
-            where_clause = "b.beer_name LIKE %s"
-            search_param = f'%{query}%'
-        elif search_type == 'style':
-            where_clause = "b.style LIKE %s"
-            search_param = f'%{query}%'
-        else:
-            # Search all
-            where_clause = "(br.brewery_name LIKE %s OR b.beer_name LIKE %s OR b.style LIKE %s)"
-            search_param = None  # Will use multiple params
-        
-        # Get venues with beers matching the search
-        sql = """
-            SELECT DISTINCT
-                v.venue_id,
-                v.venue_name,
-                v.address,
-                v.postcode,
-                v.city,
-                v.latitude,
-                v.longitude,
-                v.country,
-                ANY_VALUE(COALESCE(s.status, 'unknown')) as gf_status,
-                GROUP_CONCAT(
-                    DISTINCT CONCAT(vb.format, ' - ', 
-                    COALESCE(br.brewery_name, 'Unknown'), ' ', 
-                    COALESCE(b.beer_name, 'Unknown'), ' (', 
-                    COALESCE(b.style, 'Unknown'), ')')
-                    SEPARATOR ', '
-                ) as beer_details
-            FROM venue_beers vb
-            JOIN venues v ON vb.venue_id = v.venue_id
-            LEFT JOIN beers b ON vb.beer_id = b.beer_id
-            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
-            LEFT JOIN gf_status s ON v.venue_id = s.venue_id
-            WHERE """ + where_clause
-        
-        if gf_only:
-            sql += " AND s.status IN ('always_tap_cask', 'always_bottle_can', 'currently')"
-        
-        sql += " GROUP BY v.venue_id"
-        
-        # Execute count query first
-        count_sql = f"SELECT COUNT(DISTINCT v.venue_id) as total FROM venue_beers vb JOIN venues v ON vb.venue_id = v.venue_id LEFT JOIN beers b ON vb.beer_id = b.beer_id LEFT JOIN breweries br ON b.brewery_id = br.brewery_id LEFT JOIN gf_status s ON v.venue_id = s.venue_id WHERE {where_clause}"
-        
-        if search_param:
-            cursor.execute(count_sql, (search_param,) if search_type != 'all' else (f'%{query}%', f'%{query}%', f'%{query}%'))
-        else:
-            cursor.execute(count_sql, (f'%{query}%', f'%{query}%', f'%{query}%'))
-            
-        total_count = cursor.fetchone()['total']
-        
-        # Add pagination
+        # Paginated - total comes back on every row via COUNT(*) OVER()
         per_page = 20
         offset = (page - 1) * per_page
-        sql += f" LIMIT {per_page} OFFSET {offset}"
-        
-        # Execute main query
-        if search_param:
-            cursor.execute(sql, (search_param,))
+        param = fulltext_prefix_query(query)
+        prefix = not param
+        if prefix:
+            conditions, param = BEER_SEARCH_PREFIX_CONDITIONS, f'{query}%'
         else:
-            cursor.execute(sql, (f'%{query}%', f'%{query}%', f'%{query}%'))
+            conditions = BEER_SEARCH_CONDITIONS
+        match_params = (param,) * (3 if search_type == 'all' else 1)
         
-        venues = cursor.fetchall()
-        
-        # Add local_authority for frontend
-        for venue in venues:
-            venue['local_authority'] = venue['city']
+        cursor.execute(BEER_SEARCH_SQL[(search_type, gf_only, prefix)], match_params + (per_page, offset))
+        # Each venue lists only the beers that matched the search
+        venues = attach_beer_details(conn, cursor.fetchall(),
+                                     conditions[search_type], match_params)
+        total_count = take_total(venues)
         
         return jsonify({
             'venues': venues,
@@ -1212,10 +1618,86 @@ def search_by_beer():
     except Exception as e:
         logger.error(f"Beer search error: {str(e)}")
         return jsonify({'error': 'Search failed'}), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
+
+# Verify the user and look up the brewery and beer in one round trip - the
+# LEFT JOINs leave brewery_id and beer_id NULL for whatever doesn't exist yet.
+# Names compare case-insensitively through the column collation, so the bare
+# columns can use the unique keys (migrations/013).
+REPORT_LOOKUP_SQL = """
+    SELECT u.user_id, u.nickname, br.brewery_id, b.beer_id
+    FROM users u
+    LEFT JOIN breweries br ON br.brewery_name = %s
+    LEFT JOIN beers b ON b.brewery_id = br.brewery_id
+        AND b.beer_name = %s
+    WHERE u.user_id = %s AND u.is_active = 1
+    ORDER BY b.beer_id IS NULL
+    LIMIT 1
+"""
+
+# A brewery or beer added by a concurrent report since the lookup hits the
+# unique key instead (uq_brewery_name, uq_beer_brewery_name, migrations/013);
+# LAST_INSERT_ID(id) makes lastrowid that row's id either way
+INSERT_BREWERY_SQL = """
+    INSERT INTO breweries (brewery_name, created_by_id)
+    VALUES (%s, %s)
+    ON DUPLICATE KEY UPDATE brewery_id = LAST_INSERT_ID(brewery_id)
+"""
+
+INSERT_BEER_SQL = """
+    INSERT INTO beers (brewery_id, beer_name, style, abv, gluten_status, created_by_id)
+    VALUES (%s, %s, %s, %s, 'gluten_removed', %s)
+    ON DUPLICATE KEY UPDATE beer_id = LAST_INSERT_ID(beer_id)
+"""
+
+# LAST_INSERT_ID(report_id) makes lastrowid the existing row's id on the
+# update path (uq_venue_beer_format, migrations/007)
+UPSERT_VENUE_BEER_SQL = """
+    INSERT INTO venue_beers (venue_id, beer_id, user_id, format, last_seen)
+    VALUES (%s, %s, %s, %s, CURRENT_DATE)
+    ON DUPLICATE KEY UPDATE
+        last_seen = CURRENT_DATE,
+        user_id = %s,
+        report_id = LAST_INSERT_ID(report_id)
+"""
+
+ACTIVE_USER_SQL = "SELECT nickname FROM users WHERE user_id = %s AND is_active = 1"
+
+# Record a GF status change with the current status as the audit trail's
+# old_status, in one statement - nothing is inserted when the status isn't
+# actually changing
+INSERT_STATUS_UPDATE_SQL = """
+    INSERT INTO status_updates (venue_id, old_status, new_status, user_id, updated_at)
+    SELECT %s, cur.status, %s, %s, NOW()
+    FROM (
+        SELECT COALESCE((SELECT status FROM gf_status WHERE venue_id = %s), 'unknown') AS status
+    ) cur
+    WHERE cur.status <> %s
+"""
+
+# Duplicate checks for a new venue. The name comparison is already
+# case-insensitive through the column collation, and bare columns let the
+# postcode/name and lat/lng indexes serve the lookup.
+VENUE_BY_POSTCODE_SQL = """
+    SELECT venue_id FROM venues 
+    WHERE postcode = %s AND venue_name = %s
+"""
+
+VENUE_BY_LOCATION_SQL = """
+    SELECT venue_id FROM venues 
+    WHERE latitude BETWEEN %s AND %s
+    AND longitude BETWEEN %s AND %s
+    AND venue_name = %s
+"""
+
+INSERT_VENUE_SQL = """
+    INSERT INTO venues (
+        venue_name, street, city, postcode, 
+        address, latitude, longitude, 
+        venue_type, country, added_by_user_id
+    ) VALUES (
+        %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
+    )
+"""
 
 @app.route('/api/submit_beer_update', methods=['POST'])
 def submit_beer_update():
@@ -1242,62 +1724,38 @@ def submit_beer_update():
         if not all([venue_id, format_type, brewery_name, beer_name]):
             return jsonify({'error': 'Missing required fields'}), 400
         
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
+        # The lookup and up to three inserts commit together - one log flush,
+        # and no half-written brewery or beer if a later step fails
+        conn.start_transaction()
         cursor = conn.cursor(dictionary=True)
         
-        # Verify user exists and is active
-        cursor.execute("""
-            SELECT user_id, nickname FROM users 
-            WHERE user_id = %s AND is_active = 1
-        """, (user_id,))
+        cursor.execute(REPORT_LOOKUP_SQL, (brewery_name, beer_name, user_id))
         
         user = cursor.fetchone()
         if not user:
             return jsonify({'error': 'Invalid user'}), 401
         
-        # STEP 1: Check if brewery exists, if not add it
-        cursor.execute("""
-            SELECT brewery_id FROM breweries 
-            WHERE LOWER(brewery_name) = LOWER(%s)
-        """, (brewery_name,))
-        
-        brewery_rows = cursor.fetchall()
+        # STEP 1: Add the brewery if it doesn't exist
+        brewery_id = user['brewery_id']
+        new_brewery = brewery_id is None
         
-        if brewery_rows:
-            brewery_id = brewery_rows[0]['brewery_id']
+        if not new_brewery:
             logger.info(f"Found existing brewery: {brewery_name} (ID: {brewery_id})")
         else:
             # Add new brewery - ONLY store user_id
-            cursor.execute("SELECT MAX(brewery_id) as max_id FROM breweries")
-            max_rows = cursor.fetchall()
-            max_brewery_id = max_rows[0]['max_id'] if max_rows[0]['max_id'] else 0
-            brewery_id = max_brewery_id + 1
-            
-            cursor.execute("""
-                INSERT INTO breweries (brewery_id, brewery_name, created_by_id)
-                VALUES (%s, %s, %s)
-            """, (brewery_id, brewery_name, user_id))
+            cursor.execute(INSERT_BREWERY_SQL, (brewery_name, user_id))
+            brewery_id = cursor.lastrowid
             
             logger.info(f"Added new brewery: {brewery_name} (ID: {brewery_id}) by user {user_id}")
         
-        # STEP 2: Check if beer exists, if not add it
-        cursor.execute("""
-            SELECT beer_id FROM beers 
-            WHERE brewery_id = %s AND LOWER(beer_name) = LOWER(%s)
-        """, (brewery_id, beer_name))
-        
-        beer_rows = cursor.fetchall()
+        # STEP 2: Add the beer if it doesn't exist
+        beer_id = user['beer_id']
         
-        if beer_rows:
-            beer_id = beer_rows[0]['beer_id']
+        if beer_id is not None:
             logger.info(f"Found existing beer: {beer_name} (ID: {beer_id})")
         else:
             # Add new beer - ONLY store user_id
-            cursor.execute("SELECT MAX(beer_id) as max_id FROM beers")
-            max_rows = cursor.fetchall()
-            max_beer_id = max_rows[0]['max_id'] if max_rows[0]['max_id'] else 0
-            beer_id = max_beer_id + 1
-            
             abv_value = None
             if beer_abv:
                 try:
@@ -1305,46 +1763,27 @@ def submit_beer_update():
                 except (ValueError, TypeError):
                     abv_value = None
             
-            cursor.execute("""
-                INSERT INTO beers (brewery_id, beer_id, beer_name, style, abv, gluten_status, created_by_id)
-                VALUES (%s, %s, %s, %s, %s, 'gluten_removed', %s)
-            """, (brewery_id, beer_id, beer_name, beer_style, abv_value, user_id))
+            cursor.execute(INSERT_BEER_SQL, (brewery_id, beer_name, beer_style, abv_value, user_id))
+            beer_id = cursor.lastrowid
             
             logger.info(f"Added new beer: {brewery_name} - {beer_name} (ID: {beer_id}) by user {user_id}")
         
-        # STEP 3: Check if this beer is already reported for this venue
-        cursor.execute("""
-            SELECT report_id FROM venue_beers 
-            WHERE venue_id = %s AND beer_id = %s AND format = %s
-        """, (venue_id, beer_id, format_type))
-        
-        existing_reports = cursor.fetchall()
-        
-        if existing_reports:
-            existing_report = existing_reports[0]
-            # Update existing report - ONLY user_id
-            cursor.execute("""
-                UPDATE venue_beers 
-                SET last_seen = CURRENT_DATE,
-                    user_id = %s
-                WHERE report_id = %s
-            """, (user_id, existing_report['report_id']))
-            report_id = existing_report['report_id']
-            logger.info(f"Updated existing report {report_id} by user {user_id}")
-        else:
-            # Insert new report - ONLY user_id
-            cursor.execute("""
-                INSERT INTO venue_beers (venue_id, beer_id, user_id, format, last_seen)
-                VALUES (%s, %s, %s, %s, CURRENT_DATE)
-            """, (venue_id, beer_id, user_id, format_type))
-            report_id = cursor.lastrowid
+        # STEP 3: Add the report for this venue, or refresh the existing one
+        cursor.execute(UPSERT_VENUE_BEER_SQL, (venue_id, beer_id, user_id, format_type, user_id))
+        report_id = cursor.lastrowid
+        if cursor.rowcount == 1:
             logger.info(f"Added new venue_beer report {report_id} by user {user_id}")
+        else:
+            logger.info(f"Updated existing report {report_id} by user {user_id}")
         
         conn.commit()
+        invalidate_recent_finds_cache()
+        if new_brewery:
+            invalidate_brewery_cache()
+        refresh_venues_search(conn, [venue_id])
         
-        # Update user stats and points
+        # Points are totalled by the user_stats VIEW from the records just committed
         points_earned = 15
-        update_user_stats(user_id, 'beer_report', points_earned)
         logger.info(f"Awarded {points_earned} points to user {user_id} ({user['nickname']})")
         
         return jsonify({
@@ -1361,7 +1800,6 @@ def submit_beer_update():
         
     except Exception as e:
         logger.error(f"Error in submit_beer_update: {str(e)}")
-        import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         if 'conn' in locals():
             conn.rollback()
@@ -1369,10 +1807,6 @@ def submit_beer_update():
             'success': False,
             'error': 'Failed to process beer report. Please try again.'
         }), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
 
 @app.route('/api/update-gf-status', methods=['POST'])
 def update_gf_status():
@@ -1394,23 +1828,18 @@ def update_gf_status():
         if new_status not in valid_statuses:
             return jsonify({'error': f'Invalid status. Must be one of: {", ".join(valid_statuses)}'}), 400
         
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
         # Verify user exists
-        cursor.execute("SELECT nickname FROM users WHERE user_id = %s AND is_active = 1", (user_id,))
+        cursor.execute(ACTIVE_USER_SQL, (user_id,))
         user = cursor.fetchone()
         if not user:
             return jsonify({'error': 'Invalid user'}), 401
         
-        # Get current status for audit trail
-        cursor.execute("SELECT status FROM gf_status WHERE venue_id = %s", (venue_id,))
-        current_row = cursor.fetchone()
-        old_status = current_row['status'] if current_row else 'unknown'
+        cursor.execute(INSERT_STATUS_UPDATE_SQL, (venue_id, new_status, user_id, venue_id, new_status))
         
-        # FIX 1: Check if status is actually changing
-        if old_status == new_status:
-            conn.close()
+        if cursor.rowcount == 0:
             logger.info(f"Status unchanged for venue {venue_id}: {new_status} (skipped duplicate)")
             return jsonify({
                 'success': True,
@@ -1420,19 +1849,15 @@ def update_gf_status():
                 'points_earned': 0
             })
         
-        # Insert into status_updates table - ONLY user_id
-        cursor.execute("""
-            INSERT INTO status_updates (venue_id, old_status, new_status, user_id, updated_at)
-            VALUES (%s, %s, %s, %s, NOW())
-        """, (venue_id, old_status, new_status, user_id))
-        
         conn.commit()
+        invalidate_all_venues_cache()
+        refresh_venues_search(conn, [venue_id])
         
-        # Update user stats and points
+        # Points are totalled by the user_stats VIEW from the records just committed
         points_earned = 5
-        update_user_stats(user_id, 'status_update', points_earned)
+        logger.info(f"User {user_id}: status_update (+{points_earned} points)")
         
-        logger.info(f"Updated venue {venue_id} GF status from {old_status} to {new_status} by user {user_id} ({user['nickname']})")
+        logger.info(f"Updated venue {venue_id} GF status to {new_status} by user {user_id} ({user['nickname']})")
         
         return jsonify({
             'success': True,
@@ -1448,14 +1873,10 @@ def update_gf_status():
         if 'conn' in locals():
             conn.rollback()
         return jsonify({'error': f'Failed to update status: {str(e)}'}), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
 
 @app.route('/api/venue/<int:venue_id>/status-confirmations')
 def get_status_confirmations(venue_id):
-    conn = mysql.connector.connect(**db_config)
+    conn = get_db()
     cursor = conn.cursor(dictionary=True)
     
     # Get most recent confirmation and count of unique users in last 7 days
@@ -1489,6 +1910,20 @@ def get_status_confirmations(venue_id):
             'has_confirmations': False
         })
 
+# Status confirmation statements, kept as constants like the write-path ones above
+RECENT_CONFIRMATION_SQL = """
+    SELECT confirmed_at 
+    FROM status_confirmations 
+    WHERE venue_id = %s 
+    AND user_id = %s 
+    AND confirmed_at > DATE_SUB(NOW(), INTERVAL 48 HOUR)
+"""
+
+INSERT_CONFIRMATION_SQL = """
+    INSERT INTO status_confirmations (venue_id, user_id, status_confirmed, confirmed_at)
+    VALUES (%s, %s, %s, NOW())
+"""
+
 @app.route('/api/venue/confirm-status', methods=['POST'])
 def confirm_venue_status():
     """Confirm a venue's GF status"""
@@ -1501,23 +1936,17 @@ def confirm_venue_status():
         if not venue_id or not status or not user_id:
             return jsonify({'error': 'Missing required fields'}), 400
         
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
         # Check if user exists
-        cursor.execute("SELECT nickname FROM users WHERE user_id = %s AND is_active = 1", (user_id,))
+        cursor.execute(ACTIVE_USER_SQL, (user_id,))
         user = cursor.fetchone()
         if not user:
             return jsonify({'error': 'Invalid user'}), 401
         
         # Check if user already confirmed this status in last 24 hours
-        cursor.execute("""
-            SELECT confirmed_at 
-            FROM status_confirmations 
-            WHERE venue_id = %s 
-            AND user_id = %s 
-            AND confirmed_at > DATE_SUB(NOW(), INTERVAL 48 HOUR)
-        """, (venue_id, user_id))
+        cursor.execute(RECENT_CONFIRMATION_SQL, (venue_id, user_id))
         
         recent_confirmation = cursor.fetchone()
         
@@ -1529,16 +1958,13 @@ def confirm_venue_status():
             }), 200
         
         # Insert confirmation
-        cursor.execute("""
-            INSERT INTO status_confirmations (venue_id, user_id, status_confirmed, confirmed_at)
-            VALUES (%s, %s, %s, NOW())
-        """, (venue_id, user_id, status))
+        cursor.execute(INSERT_CONFIRMATION_SQL, (venue_id, user_id, status))
         
         conn.commit()
         
         # Award points
         points_earned = 5
-        update_user_stats(user_id, 'status_confirmation', points_earned)
+        logger.info(f"User {user_id}: status_confirmation (+{points_earned} points)")
         
         logger.info(f"Status confirmed for venue {venue_id} by user {user_id} ({user['nickname']})")
         
@@ -1553,65 +1979,78 @@ def confirm_venue_status():
         if 'conn' in locals():
             conn.rollback()
         return jsonify({'error': 'Failed to confirm status'}), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
                     
+# The same prefixes come up again and again across users, so recent
+# suggestion lists are kept in-process for a minute, already encoded and
+# with their ETag, so a hit skips the query, the encode and the hash.
+# Identical lookups that arrive while one is already running wait for its
+# result instead of issuing their own query.
+_autocomplete_cache = TTLCache(maxsize=10000, ttl=60)
+_autocomplete_inflight = {}
+_autocomplete_lock = threading.Lock()
+
+def autocomplete_lookup(query, search_type, gf_only, limit):
+    """Encoded suggestions and their ETag for a normalised query, from the cache when possible"""
+    param = fulltext_prefix_query(query) if search_type in ('name', 'all') else None
+    if not param:
+        if search_type in ('name', 'all'):
+            search_type += '_prefix'
+        param = f'{query}%'
+    params = (param,) * AUTOCOMPLETE_CONDITIONS[search_type].count('%s')
+    
+    key = (query, search_type, gf_only, limit)
+    with _autocomplete_lock:
+        cached = _autocomplete_cache.get(key)
+        if cached is not None:
+            return cached
+        future = _autocomplete_inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _autocomplete_inflight[key] = Future()
+    
+    if not leader:
+        return future.result()
+    
+    try:
+        cursor = get_db().cursor()
+        cursor.execute(AUTOCOMPLETE_SQL[(search_type, gf_only)], (*params, limit))
+        body = app.json.encode(fetch_dicts(cursor))
+        cached = (body, hashlib.blake2b(body, digest_size=8).hexdigest())
+        
+        with _autocomplete_lock:
+            _autocomplete_cache[key] = cached
+        future.set_result(cached)
+        return cached
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _autocomplete_lock:
+            _autocomplete_inflight.pop(key, None)
+
 @app.route('/autocomplete')
 def autocomplete():
     """Autocomplete suggestions for search"""
-    query = request.args.get('q', '').strip()
+    query = request.args.get('q', '').strip().lower()
     search_type = request.args.get('search_type', 'all')
     gf_only = request.args.get('gf_only', 'false').lower() == 'true'
+    limit = min(max(request.args.get('limit', 10, type=int), 1), 50)
     
     if not query or len(query) < 2 or len(query) > 100:
         return jsonify([])
 
+    if search_type not in AUTOCOMPLETE_CONDITIONS:
+        search_type = 'all'
+
     try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor(dictionary=True)
-        
-        # Build search condition for new schema
-        if search_type == 'name':
-            search_condition = "v.venue_name LIKE %s"
-            params = (f'%{query}%',)
-        elif search_type == 'postcode':
-            search_condition = "v.postcode LIKE %s"
-            params = (f'%{query}%',)
-        elif search_type == 'area':
-            search_condition = "v.city LIKE %s"
-            params = (f'%{query}%',)
-        else:
-            search_condition = "(v.venue_name LIKE %s OR v.postcode LIKE %s OR v.city LIKE %s OR v.address LIKE %s)"
-            params = (f'%{query}%', f'%{query}%', f'%{query}%', f'%{query}%')
-        
-        # Updated query for new schema
-        sql = f"""
-            SELECT v.venue_id, v.venue_name, 
-                   v.address, 
-                   v.postcode
-            FROM venues v
-            LEFT JOIN gf_status s ON v.venue_id = s.venue_id
-            WHERE {search_condition}
-        """
-        
-        if gf_only:
-            sql += " AND s.status IN ('always_tap_cask', 'always_bottle_can', 'currently')"
-        
-        sql += " ORDER BY v.venue_name"
-        cursor.execute(sql, params)
-        venues = cursor.fetchall()
-        
-        return jsonify(venues)
+        body, etag = autocomplete_lookup(query, search_type, gf_only, limit)
+        response = app.response_class(body, mimetype='application/json')
+        response.set_etag(etag)
+        return conditional_response(response, 'public, max-age=30')
         
     except mysql.connector.Error as e:
         logger.error(f"Database error in autocomplete: {str(e)}")
         return jsonify([])
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
 
 
 
@@ -1629,7 +2068,7 @@ def check_nickname():
     if nickname.lower() in banned_words:
         return jsonify({'available': False, 'error': 'Reserved name'})
     
-    conn = mysql.connector.connect(**db_config)  # FIXED: Use the same connection method
+    conn = get_db()
     cursor = conn.cursor()
     
     try:
@@ -1652,11 +2091,10 @@ def check_nickname():
         
     finally:
         cursor.close()
-        conn.close()
 
 @app.route('/api/user/get/<uuid>')
 def get_user(uuid):
-    conn = mysql.connector.connect(**db_config)  # FIXED
+    conn = get_db()
     cursor = conn.cursor(dictionary=True)
     
     try:
@@ -1689,11 +2127,10 @@ def get_user(uuid):
         return jsonify({'error': 'Database error'}), 500
     finally:
         cursor.close()
-        conn.close()
 
 @app.route('/api/user/update-active/<uuid>', methods=['POST'])
 def update_last_active(uuid):
-    conn = mysql.connector.connect(**db_config)  # FIXED
+    conn = get_db()
     cursor = conn.cursor()
     
     try:
@@ -1708,7 +2145,6 @@ def update_last_active(uuid):
         
     finally:
         cursor.close()
-        conn.close()
 
 
 
@@ -1716,6 +2152,16 @@ def update_last_active(uuid):
 # API ROUTES
 # ================================================================================
 
+# Beer name lookups from the report form. Word-prefix FULLTEXT finds matches
+# mid-name; queries with no indexed word are an anchored LIKE on the name
+# index.
+def beer_name_condition(query):
+    """Return the WHERE fragment and parameter matching b.beer_name against query"""
+    fulltext_query = fulltext_prefix_query(query)
+    if fulltext_query:
+        return "MATCH(b.beer_name) AGAINST (%s IN BOOLEAN MODE)", fulltext_query
+    return "b.beer_name LIKE %s", f'{query}%'
+
 @app.route('/api/beers/search', methods=['GET'])
 def search_beers_globally():
     """Search all beers in database (for when user doesn't know brewery)"""
@@ -1725,11 +2171,13 @@ def search_beers_globally():
         return jsonify([])
     
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
+        condition, param = beer_name_condition(query)
+        
         # Search beers and include brewery info
-        cursor.execute("""
+        cursor.execute(f"""
             SELECT 
                 b.beer_id,
                 b.beer_name,
@@ -1739,16 +2187,15 @@ def search_beers_globally():
                 b.gluten_status
             FROM beers b
             LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
-            WHERE b.beer_name LIKE %s
+            WHERE {condition}
             ORDER BY 
                 CASE 
                     WHEN b.beer_name LIKE %s THEN 0
-                    WHEN b.beer_name LIKE %s THEN 1
-                    ELSE 2
+                    ELSE 1
                 END,
                 b.beer_name
             LIMIT 20
-        """, (f'%{query}%', f'{query}%', f'%{query}%'))
+        """, (param, f'{query}%'))
         
         beers = cursor.fetchall()
         
@@ -1758,7 +2205,6 @@ def search_beers_globally():
                 beer['abv'] = float(beer['abv'])
         
         cursor.close()
-        conn.close()
         
         return jsonify(beers)
         
@@ -1766,58 +2212,139 @@ def search_beers_globally():
         logger.error(f"Error searching beers: {str(e)}")
         return jsonify([]), 500
 
+# ================================================================================
+# BREWERY NAME CACHE
+# ================================================================================
+
+# The report form pulls the full brewery list on every keystroke, but it only
+# grows when a report names a new brewery. Keep it in memory, ordered by
+# lowercased name so a prefix lookup is two bisects instead of a table scan.
+BREWERY_CACHE_TTL = 600
+_brewery_cache = {'names': None, 'keys': None, 'body': None, 'etag': None, 'built_at': 0}
+_brewery_lock = threading.Lock()
+
+def invalidate_brewery_cache():
+    """Drop the cached brewery list so the next request reloads it"""
+    _brewery_cache['names'] = None
+
+def get_brewery_index():
+    """Return (keys, names) - lowercased sort keys and display names, in step"""
+    with _brewery_lock:
+        if _brewery_cache['names'] is None or time.time() - _brewery_cache['built_at'] > BREWERY_CACHE_TTL:
+            # Unbuffered - sorted() drains the cursor before it is closed
+            cursor = get_db().cursor(buffered=False)
+            
+            try:
+                # Names are unique (uq_brewery_name, migrations/013) - no
+                # DISTINCT, and the ORDER BY is a walk of that index. The
+                # collation's order isn't exactly str.lower's, which bisect
+                # relies on, so the rows are still sorted here - near-linear
+                # for Timsort on input that is already almost in order.
+                cursor.execute("SELECT brewery_name FROM breweries ORDER BY brewery_name")
+                # Straight off the cursor into the sorted list - no row list in between
+                names = sorted(filter(None, map(itemgetter(0), cursor)), key=str.lower)
+            finally:
+                cursor.close()
+            
+            _brewery_cache['names'] = names
+            _brewery_cache['keys'] = [name.lower() for name in names]
+            _brewery_cache['body'] = None
+            _brewery_cache['built_at'] = time.time()
+        
+        return _brewery_cache['keys'], _brewery_cache['names']
+
+def get_brewery_list_body():
+    """Return the encoded full brewery list and its ETag, encoding once per reload"""
+    _, names = get_brewery_index()
+    with _brewery_lock:
+        if _brewery_cache['names'] is names and _brewery_cache['body'] is not None:
+            return _brewery_cache['body'], _brewery_cache['etag']
+        
+        body = app.json.encode(names)
+        etag = hashlib.sha1(body).hexdigest()
+        # Only keep it if the list wasn't reloaded or invalidated meanwhile
+        if _brewery_cache['names'] is names:
+            _brewery_cache['body'] = body
+            _brewery_cache['etag'] = etag
+        return body, etag
+
+# Filtered (?q=) brewery and beer lookups feed autocompletes, so they return
+# a page of suggestions; ?limit= and ?offset= page further. The unfiltered
+# lists back the brewery pages and stay whole unless a limit is asked for,
+# with a hard cap on a single brewery's beers.
+SUGGESTION_LIMIT = 20
+SUGGESTION_LIMIT_MAX = 100
+BREWERY_BEERS_MAX = 500
+
+def suggestion_paging(filtered, default_unfiltered=None):
+    """Return (limit, offset) from the query string, clamped; limit None means no limit"""
+    limit = request.args.get('limit', type=int)
+    offset = max(request.args.get('offset', 0, type=int), 0)
+    if limit is not None:
+        limit = min(max(limit, 1), SUGGESTION_LIMIT_MAX)
+    elif filtered:
+        limit = SUGGESTION_LIMIT
+    else:
+        limit = default_unfiltered
+    return limit, offset
+
 @app.route('/api/breweries', methods=['GET'])
 def get_breweries():
     """Get breweries for autocomplete"""
-    query = request.args.get('q', '').strip()
+    query = request.args.get('q', '').strip().lower()
+    limit, offset = suggestion_paging(bool(query))
     
     try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor()
+        keys, names = get_brewery_index()
         
         if query:
-            cursor.execute("""
-                SELECT DISTINCT brewery_name
-                FROM breweries 
-                WHERE brewery_name LIKE %s
-                ORDER BY brewery_name
-            """, (f'%{query}%',))
-        else:
-            cursor.execute("""
-                SELECT DISTINCT brewery_name 
-                FROM breweries 
-                ORDER BY brewery_name
-            """)
-        
-        breweries = [row[0] for row in cursor.fetchall()]
-        return jsonify(breweries)
+            # Prefix matches first - every key starting with query sorts
+            # between these
+            start = bisect.bisect_left(keys, query)
+            end = bisect.bisect_left(keys, query + '\uffff')
+            matches = names[start:end]
+            # then, if the page reaches past them, names containing the query
+            # further in, still in name order
+            wanted = offset + limit - len(matches)
+            if wanted > 0:
+                matches += islice((name for key, name in zip(keys, names)
+                                   if query in key and not key.startswith(query)), wanted)
+            return jsonify(matches[offset:offset + limit])
+        
+        if limit is not None:
+            return jsonify(names[offset:offset + limit])
+        
+        # The unfiltered list is the big one - serve the pre-encoded body
+        body, etag = get_brewery_list_body()
+        response = app.response_class(body, mimetype='application/json')
+        response.set_etag(etag)
+        return conditional_response(response, f'public, max-age={BREWERY_CACHE_TTL}')
         
     except Exception as e:
         logger.error(f"Error fetching breweries: {str(e)}")
         return jsonify([])
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
 
 @app.route('/api/brewery/<brewery_name>/beers', methods=['GET'])
 def get_brewery_beers(brewery_name):
     """Get beers for a specific brewery"""
     query = request.args.get('q', '').strip()
+    limit, offset = suggestion_paging(bool(query), BREWERY_BEERS_MAX)
     
     try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor(dictionary=True)
+        conn = get_db()
+        cursor = conn.cursor()
         
         if query:
-            cursor.execute("""
+            condition, param = beer_name_condition(query)
+            cursor.execute(f"""
                 SELECT beer_id, beer_name, style, abv, gluten_status, vegan_status
                 FROM beers b
                 LEFT JOIN breweries br
                 ON b.brewery_id = br.brewery_id
-                WHERE brewery_name = %s AND beer_name LIKE %s
+                WHERE brewery_name = %s AND {condition}
                 ORDER BY beer_name
-            """, (brewery_name, f'%{query}%'))
+                LIMIT %s OFFSET %s
+            """, (brewery_name, param, limit, offset))
         else:
             cursor.execute("""
                 SELECT beer_id, beer_name, style, abv, gluten_status, vegan_status
@@ -1826,24 +2353,42 @@ def get_brewery_beers(brewery_name):
                 ON b.brewery_id = br.brewery_id
                 WHERE brewery_name = %s
                 ORDER BY beer_name
-            """, (brewery_name,))
+                LIMIT %s OFFSET %s
+            """, (brewery_name, limit, offset))
         
-        beers = cursor.fetchall()
-        return jsonify(beers)
+        return jsonify(fetch_dicts(cursor))
         
     except Exception as e:
         logger.error(f"Error fetching beers for {brewery_name}: {str(e)}")
         return jsonify([])
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
+
+@app.route('/api/venue/<int:venue_id>', methods=['GET'])
+def get_venue_details(venue_id):
+    """Get the address details the map leaves out of its pins"""
+    try:
+        cursor = get_db().cursor(dictionary=True)
+        cursor.execute("""
+            SELECT venue_id, address, postcode, city, country
+            FROM venues
+            WHERE venue_id = %s
+        """, (venue_id,))
+        venue = cursor.fetchone()
+        cursor.close()
+        
+        if not venue:
+            return jsonify({'success': False, 'error': 'Venue not found'}), 404
+        
+        return conditional_response(jsonify({'success': True, 'venue': venue}), 'public, max-age=300')
+        
+    except Exception as e:
+        logger.error(f"Error fetching venue {venue_id}: {str(e)}")
+        return jsonify({'success': False, 'error': 'Failed to load venue'}), 500
 
 @app.route('/api/venue/<int:venue_id>/beers', methods=['GET'])
 def get_venue_beers(venue_id):
     """Get structured beer data for a venue"""
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
         cursor.execute("""
@@ -1871,7 +2416,6 @@ def get_venue_beers(venue_id):
                 beer['added_date'] = beer['added_date'].isoformat()
         
         cursor.close()
-        conn.close()
         
         return jsonify({
             'venue_id': venue_id,
@@ -1884,46 +2428,196 @@ def get_venue_beers(venue_id):
         return jsonify({'venue_id': venue_id, 'beers': [], 'count': 0}), 200
                 
 
+# ================================================================================
+# MAP PAYLOAD CACHE
+# ================================================================================
+
+# /api/all-venues ships every mapped venue, but the data only changes when a
+# venue is added or a GF status updated. The gzipped JSON body is built once
+# and served as-is until one of those writes invalidates it, or the TTL runs
+# out. The gunicorn workers share the body through ALL_VENUES_CACHE_FILE: one
+# build serves them all, and deleting the file passes an invalidation on. If
+# the file can't be written each worker keeps its own copy for the TTL. It
+# lives in the app's instance folder rather than the shared temp directory,
+# where any local user could plant a file under the same name.
+ALL_VENUES_CACHE_TTL = 300
+ALL_VENUES_FETCH_BATCH = 5000
+ALL_VENUES_CACHE_FILE = os.getenv('ALL_VENUES_CACHE_FILE',
+                                  os.path.join(app.instance_path, 'all_venues.json.gz'))
+_all_venues_cache = {'blob': None, 'etag': None, 'built_at': 0, 'shared': False}
+_all_venues_lock = threading.Lock()
+
+# Viewport requests (?bbox=minLon,minLat,maxLon,maxLat) only ship the venues
+# on screen. Bounds are rounded so small pans share an entry; the short TTL
+# keeps these in line with the full payload without explicit invalidation.
+BBOX_CACHE_TTL = 60
+BBOX_PRECISION = 3
+_bbox_cache = TTLCache(maxsize=512, ttl=BBOX_CACHE_TTL)
+_bbox_lock = threading.Lock()
+
+# Only what a pin needs - the popup's address comes from /api/venue/<id>
+# when it is opened
+ALL_VENUES_SQL = """
+    SELECT 
+        v.venue_id as venue_id, v.venue_name, 
+        v.latitude, v.longitude,
+        COALESCE(s.status, 'unknown') as gf_status
+    FROM venues v
+    LEFT JOIN gf_status s ON v.venue_id = s.venue_id
+    WHERE v.latitude IS NOT NULL AND v.longitude IS NOT NULL 
+    AND v.latitude != 0 AND v.longitude != 0
+    {bbox}
+    ORDER BY s.status ASC
+"""
+# Range scan on idx_venue_lat_lng (migrations/002)
+BBOX_FILTER = "AND v.latitude BETWEEN %s AND %s AND v.longitude BETWEEN %s AND %s"
+
+def invalidate_all_venues_cache():
+    """Drop the cached map payload, here and for the other workers, so the next request rebuilds it"""
+    _all_venues_cache['blob'] = None
+    try:
+        os.remove(ALL_VENUES_CACHE_FILE)
+    except OSError:
+        pass
+    with _bbox_lock:
+        _bbox_cache.clear()
+
+def parse_bbox(value):
+    """Parse a minLon,minLat,maxLon,maxLat string into rounded bounds, or None if invalid"""
+    try:
+        min_lon, min_lat, max_lon, max_lat = (float(part) for part in value.split(','))
+    except ValueError:
+        return None
+    if not (-180 <= min_lon <= max_lon <= 180 and -90 <= min_lat <= max_lat <= 90):
+        return None
+    # Round outwards so the cached area always covers the requested one
+    scale = 10 ** BBOX_PRECISION
+    return (math.floor(min_lon * scale) / scale, math.floor(min_lat * scale) / scale,
+            math.ceil(max_lon * scale) / scale, math.ceil(max_lat * scale) / scale)
+
+def build_all_venues_blob(bbox=None):
+    """Query mapped venues, optionally within bbox, and return the gzipped JSON response body"""
+    conn = get_db()
+    # Unbuffered - rows come off the socket one batch at a time, as tuples
+    # zipped with the column names rather than the driver's per-row dicts
+    cursor = conn.cursor(buffered=False)
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)  # gzip container
+    chunks = [compressor.compress(b'{"success":true,"venues":[')]
+    total = 0
+    
+    try:
+        if bbox:
+            min_lon, min_lat, max_lon, max_lat = bbox
+            cursor.execute(ALL_VENUES_SQL.format(bbox=BBOX_FILTER),
+                           (min_lat, max_lat, min_lon, max_lon))
+        else:
+            cursor.execute(ALL_VENUES_SQL.format(bbox=''))
+        
+        columns = cursor.column_names
+        while True:
+            batch = cursor.fetchmany(ALL_VENUES_FETCH_BATCH)
+            if not batch:
+                break
+            # Encode the batch as an array and strip its brackets so the
+            # batches splice into the single "venues" array
+            encoded = app.json.encode([dict(zip(columns, row)) for row in batch])[1:-1]
+            chunks.append(compressor.compress((b',' if total else b'') + encoded))
+            total += len(batch)
+    finally:
+        cursor.close()
+    
+    chunks.append(compressor.compress(b'],"total":%d}' % total))
+    chunks.append(compressor.flush())
+    return b''.join(chunks)
+
+def write_all_venues_file(blob):
+    """Publish the map payload to the shared file, returning its mtime or None if it can't be written"""
+    try:
+        os.makedirs(os.path.dirname(ALL_VENUES_CACHE_FILE), mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(ALL_VENUES_CACHE_FILE))
+        with os.fdopen(fd, 'wb') as f:
+            f.write(blob)
+        # Readers only ever see a complete file
+        os.replace(tmp_path, ALL_VENUES_CACHE_FILE)
+        return os.stat(ALL_VENUES_CACHE_FILE).st_mtime
+    except OSError as e:
+        logger.warning(f"Could not write map payload cache file: {str(e)}")
+        return None
+
+def get_all_venues_blob():
+    """Return the cached map payload and its ETag, rebuilding if missing or expired"""
+    with _all_venues_lock:
+        now = time.time()
+        try:
+            mtime = os.stat(ALL_VENUES_CACHE_FILE).st_mtime
+        except OSError:
+            mtime = None
+        
+        if mtime is not None and now - mtime > ALL_VENUES_CACHE_TTL:
+            mtime = None
+        
+        # Built by this or another worker - load it if ours is older
+        if mtime is not None and (_all_venues_cache['blob'] is None or _all_venues_cache['built_at'] != mtime):
+            try:
+                with open(ALL_VENUES_CACHE_FILE, 'rb') as f:
+                    blob = f.read()
+                _all_venues_cache.update(blob=blob, etag=hashlib.sha1(blob).hexdigest(),
+                                         built_at=mtime, shared=True)
+            except OSError:
+                # Invalidated since the stat
+                mtime = None
+        
+        if mtime is None and (_all_venues_cache['blob'] is None or _all_venues_cache['shared']
+                              or now - _all_venues_cache['built_at'] > ALL_VENUES_CACHE_TTL):
+            blob = build_all_venues_blob()
+            mtime = write_all_venues_file(blob)
+            _all_venues_cache.update(blob=blob, etag=hashlib.sha1(blob).hexdigest(),
+                                     built_at=mtime or now, shared=mtime is not None)
+        return _all_venues_cache['blob'], _all_venues_cache['etag']
+
+def get_bbox_venues_blob(bbox):
+    """Return the cached viewport payload and its ETag for the rounded bbox"""
+    with _bbox_lock:
+        cached = _bbox_cache.get(bbox)
+    if cached is None:
+        blob = build_all_venues_blob(bbox)
+        cached = (blob, hashlib.sha1(blob).hexdigest())
+        with _bbox_lock:
+            _bbox_cache[bbox] = cached
+    return cached
+
 @app.route('/api/all-venues')
 def get_all_venues_for_map():
-    """Get all venues with coordinates for map display"""
+    """Get venues with coordinates for map display, optionally limited to ?bbox"""
+    bbox = None
+    if request.args.get('bbox'):
+        bbox = parse_bbox(request.args['bbox'])
+        if bbox is None:
+            return jsonify({
+                'success': False,
+                'error': 'bbox must be minLon,minLat,maxLon,maxLat'
+            }), 400
+    
     try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor(dictionary=True)
-        
-        # Updated query for new schema
-        cursor.execute("""
-            SELECT 
-                v.venue_id as venue_id, v.venue_name, 
-                v.address, 
-                v.postcode, v.city,
-                v.latitude, v.longitude,
-                COALESCE(s.status, 'unknown') as gf_status
-            FROM venues v
-            LEFT JOIN gf_status s ON v.venue_id = s.venue_id
-            WHERE v.latitude IS NOT NULL AND v.longitude IS NOT NULL 
-            AND v.latitude != 0 AND v.longitude != 0            
-            ORDER BY s.status ASC
-        """)
-        
-        venues = cursor.fetchall()
-        
-        return jsonify({
-            'success': True,
-            'venues': venues,
-            'total': len(venues)
-        })
-        
+        blob, etag = get_bbox_venues_blob(bbox) if bbox else get_all_venues_blob()
     except Exception as e:
         logger.error(f"Error fetching all venues: {str(e)}")
         return jsonify({
             'success': False,
             'error': 'Failed to load venues'
         }), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
+    
+    # Nearly every browser takes gzip; decompress for the odd client that doesn't
+    if 'gzip' in request.accept_encodings:
+        response = app.response_class(blob, mimetype='application/json')
+        response.headers['Content-Encoding'] = 'gzip'
+        response.set_etag(etag)
+    else:
+        response = app.response_class(gzip.decompress(blob), mimetype='application/json')
+        response.set_etag(f'{etag}-identity')
+    
+    response.headers['Vary'] = 'Accept-Encoding'
+    return conditional_response(response, 'public, max-age=60')
 
 @app.route('/api/add-venue', methods=['POST'])
 def add_venue():
@@ -1956,29 +2650,26 @@ def add_venue():
         if not postcode or postcode == 'N/A':
             postcode = ''
         
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
+        # The duplicate check and the insert share one transaction
+        conn.start_transaction()
         cursor = conn.cursor(dictionary=True)
         
         # Verify user exists
-        cursor.execute("SELECT nickname FROM users WHERE user_id = %s AND is_active = 1", (user_id,))
+        cursor.execute(ACTIVE_USER_SQL, (user_id,))
         user = cursor.fetchone()
         if not user:
             return jsonify({'error': 'Invalid user'}), 401
         
         # Check if venue already exists
         if postcode:
-            cursor.execute("""
-                SELECT venue_id FROM venues 
-                WHERE LOWER(venue_name) = LOWER(%s) AND postcode = %s
-            """, (data['venue_name'], postcode))
+            cursor.execute(VENUE_BY_POSTCODE_SQL, (postcode, data['venue_name']))
         else:
             # For international venues without postcodes, check by name and location
-            cursor.execute("""
-                SELECT venue_id FROM venues 
-                WHERE LOWER(venue_name) = LOWER(%s) 
-                AND ABS(latitude - %s) < 0.001 
-                AND ABS(longitude - %s) < 0.001
-            """, (data['venue_name'], data.get('latitude', 0), data.get('longitude', 0)))
+            lat = float(data.get('latitude') or 0)
+            lng = float(data.get('longitude') or 0)
+            cursor.execute(VENUE_BY_LOCATION_SQL,
+                           (lat - 0.001, lat + 0.001, lng - 0.001, lng + 0.001, data['venue_name']))
         
         existing = cursor.fetchone()
         if existing:
@@ -2178,15 +2869,7 @@ def add_venue():
                 clean_address = clean_address[:-1].strip()
         
         # Insert new venue
-        cursor.execute("""
-            INSERT INTO venues (
-                venue_name, street, city, postcode, 
-                address, latitude, longitude, 
-                venue_type, country, added_by_user_id
-            ) VALUES (
-                %s, %s, %s, %s, %s, %s, %s, %s, %s, %s
-            )
-        """, (
+        cursor.execute(INSERT_VENUE_SQL, (
             data['venue_name'],
             street,
             city,
@@ -2201,10 +2884,12 @@ def add_venue():
         
         venue_id = cursor.lastrowid
         conn.commit()
+        invalidate_all_venues_cache()
+        refresh_venues_search(conn, [venue_id])
         
         # Award points for adding venue
         points_earned = 20
-        update_user_stats(user_id, 'venue_add', points_earned)
+        logger.info(f"User {user_id}: venue_add (+{points_earned} points)")
         
         # Log the addition
         logger.info(f"New venue added: {data['venue_name']} (ID: {venue_id}) in {country} by user {user_id} ({user['nickname']})")
@@ -2246,12 +2931,12 @@ def add_venue():
             'success': False,
             'error': 'Failed to add venue. Please try again.'
         }), 500
-        
-    finally:
-        if conn and conn.is_connected():
-            cursor.close()
-            conn.close()
-                    
+
+# People adding a venue search for the same pubs, so Places responses are kept
+# per normalised query for an hour
+_places_cache = TTLCache(maxsize=2048, ttl=3600)
+_places_lock = threading.Lock()
+
 @app.route('/api/search-places', methods=['POST'])
 def search_places():
     """Proxy to Google Places API to hide API key"""
@@ -2262,6 +2947,12 @@ def search_places():
         if not query:
             return jsonify({'results': []})
         
+        cache_key = ' '.join(query.lower().split())
+        with _places_lock:
+            body = _places_cache.get(cache_key)
+        if body is not None:
+            return app.response_class(body, mimetype='application/json')
+        
         api_key = os.getenv('GOOGLE_PLACES_API_KEY')
         if not api_key:
             logger.error('Google Places API key not configured')
@@ -2276,12 +2967,18 @@ def search_places():
         }
         
         logger.info(f"Searching Google Places for: {query}")
-        response = requests.get(places_url, params=params, timeout=10)
+        # Fail fast on connect; the kept-alive session rarely needs one
+        response = _http.get(places_url, params=params, timeout=(3.05, 10))
         
         if response.status_code == 200:
-            places_data = response.json()
-            logger.info(f"Google Places returned {len(places_data.get('results', []))} results")
-            return jsonify(places_data)
+            # Google's JSON goes back as-is rather than being decoded and re-encoded
+            body = response.content
+            logger.info(f"Google Places returned {len(body)} bytes")
+            # Only keep real answers, not quota or key errors
+            if orjson.loads(body).get('status') in ('OK', 'ZERO_RESULTS'):
+                with _places_lock:
+                    _places_cache[cache_key] = body
+            return app.response_class(body, mimetype='application/json')
         else:
             logger.error(f"Google Places API error: {response.status_code} - {response.text}")
             return jsonify({'error': 'Places search failed', 'status': response.status_code}), 500
@@ -2300,36 +2997,6 @@ def search_places():
 
 
 
-def update_user_stats(user_id, action_type, points):
-    """Update user statistics and points"""
-    try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor()
-        
-        # Log the action
-        logger.info(f"Updating stats for user {user_id}: {action_type} (+{points} points)")
-        
-        # The user_stats VIEW will automatically calculate totals
-        # We just need to ensure the source data is updated
-        # The points come from counting records in venue_beers and status_updates
-        
-        conn.commit()
-        return True
-        
-    except Exception as e:
-        logger.error(f"Error updating user stats: {str(e)}")
-        if 'conn' in locals():
-            conn.rollback()
-        return False
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
-
-
-
-
-
 # ================================================================================
 # ADMIN ROUTES
 # ================================================================================
@@ -2337,9 +3004,8 @@ def update_user_stats(user_id, action_type, points):
 @app.route('/admin')
 def admin_dashboard():
     token = request.args.get('token')
-    expected_token = os.getenv('ADMIN_TOKEN', 'beer_admin_2025')
     
-    if not token or token != expected_token:
+    if not token or not hmac.compare_digest(token.encode(), _ADMIN_TOKEN):
         return "🔒 Access denied. Admin token required.", 403
     
     return render_template('admin.html')
@@ -2348,61 +3014,151 @@ def admin_dashboard():
 @admin_required
 def get_admin_stats():
     """Get basic admin statistics"""
+    with _stats_lock:
+        stats = _admin_stats_cache.get('stats')
+    if stats is not None:
+        return jsonify(stats)
+    
     try:
-        conn = mysql.connector.connect(**db_config)
+        conn = get_db()
         cursor = conn.cursor(dictionary=True)
         
-        # Total venue_beers reports
-        cursor.execute("SELECT COUNT(*) as count FROM venue_beers")
-        total_reports = cursor.fetchone()['count']
-        
-        # Today's reports
+        # All three counts in one round trip
         cursor.execute("""
-            SELECT COUNT(*) as count 
+            SELECT
+                COUNT(*) as total_reports,
+                COALESCE(SUM(added_at >= CURDATE() AND added_at < CURDATE() + INTERVAL 1 DAY), 0) as today_reports,
+                (SELECT COUNT(*) FROM beers) as total_beers
             FROM venue_beers
-            WHERE DATE(added_at) = CURDATE()
         """)
-        today_reports = cursor.fetchone()['count']
+        row = cursor.fetchone()
+        
+        stats = {
+            'total_submissions': row['total_reports'],
+            'today_submissions': int(row['today_reports']),
+            'total_beers': row['total_beers']
+        }
+        with _stats_lock:
+            _admin_stats_cache['stats'] = stats
+        return jsonify(stats)
+        
+    except Exception as e:
+        logger.error(f"Error getting admin stats: {str(e)}")
+        return jsonify({'error': 'Failed to load stats'}), 500
+
+GF_STATUS_BATCH_LIMIT = 500
+
+@app.route('/api/admin/gf-status-batch', methods=['POST'])
+@admin_required
+def update_gf_status_batch():
+    """Apply many GF status updates in one transaction"""
+    try:
+        data = request.get_json() or {}
+        updates = data.get('updates') or []
+        user_id = data.get('user_id')
+        
+        if not user_id:
+            return jsonify({'error': 'Missing user_id'}), 400
+        
+        if not isinstance(updates, list) or not updates:
+            return jsonify({'error': 'No updates supplied'}), 400
+        
+        if len(updates) > GF_STATUS_BATCH_LIMIT:
+            return jsonify({'error': f'Too many updates (max {GF_STATUS_BATCH_LIMIT})'}), 400
+        
+        valid_statuses = ['always_tap_cask', 'always_bottle_can', 'currently', 'not_currently', 'unknown']
+        
+        # Last update wins if a venue appears more than once
+        new_statuses = {}
+        for update in updates:
+            if not isinstance(update, dict):
+                return jsonify({'error': f'Invalid update: {update}'}), 400
+            try:
+                venue_id = int(update.get('venue_id'))
+            except (TypeError, ValueError):
+                venue_id = None
+            new_status = update.get('status')
+            if not venue_id or new_status not in valid_statuses:
+                return jsonify({'error': f'Invalid update: {update}'}), 400
+            new_statuses[venue_id] = new_status
+        
+        conn = get_db()
+        cursor = conn.cursor()
+        
+        # Same statement as the single-venue route: old_status is read in the
+        # INSERT itself, so a concurrent update can't leave it stale, and
+        # nothing is inserted for a venue already at its new status
+        changed = []
+        for venue_id, new_status in new_statuses.items():
+            cursor.execute(INSERT_STATUS_UPDATE_SQL, (venue_id, new_status, user_id, venue_id, new_status))
+            if cursor.rowcount:
+                changed.append(venue_id)
+        
+        if changed:
+            conn.commit()
+            invalidate_all_venues_cache()
+            refresh_venues_search(conn, changed)
         
-        # Total beers
-        cursor.execute("SELECT COUNT(*) as count FROM beers")
-        total_beers = cursor.fetchone()['count']
+        logger.info(f"Admin batch GF status update: {len(changed)} changed, {len(new_statuses) - len(changed)} unchanged")
         
         return jsonify({
-            'total_submissions': total_reports,
-            'today_submissions': today_reports,
-            'total_beers': total_beers
+            'success': True,
+            'updated': len(changed),
+            'unchanged': len(new_statuses) - len(changed)
         })
         
     except Exception as e:
-        logger.error(f"Error getting admin stats: {str(e)}")
-        return jsonify({'error': 'Failed to load stats'}), 500
-    finally:
-        if 'conn' in locals() and conn.is_connected():
-            cursor.close()
-            conn.close()
+        logger.error(f"Error in batch GF status update: {str(e)}")
+        if 'conn' in locals():
+            conn.rollback()
+        return jsonify({'error': f'Failed to update statuses: {str(e)}'}), 500
 
 # ================================================================================
 # HEALTH & STATIC PAGES
 # ================================================================================
 
+# Load balancers poll this every few seconds; a recent successful
+# database check is reused rather than repeated
+HEALTH_CHECK_TTL = 5
+_health = {'ok': False, 'checked_at': 0}
+
+@app.route('/health/live')
+def liveness_check():
+    """Liveness probe - the process is serving, no database access"""
+    return jsonify({
+        'status': 'alive',
+        'timestamp': time.time()
+    })
+
 @app.route('/health')
+@app.route('/health/ready')
 def health_check():
     """Health check endpoint"""
+    now = time.time()
+    if _health['ok'] and now - _health['checked_at'] < HEALTH_CHECK_TTL:
+        return jsonify({
+            'status': 'healthy',
+            'timestamp': now,
+            'database': 'connected',
+            'cached': True
+        })
+    
     try:
-        conn = mysql.connector.connect(**db_config)
-        cursor = conn.cursor()
+        cursor = get_db().cursor()
         cursor.execute("SELECT 1")
         cursor.fetchone()
         cursor.close()
-        conn.close()
+        
+        _health['ok'] = True
+        _health['checked_at'] = now
         
         return jsonify({
             'status': 'healthy',
-            'timestamp': time.time(),
+            'timestamp': now,
             'database': 'connected'
         })
     except Exception as e:
+        _health['ok'] = False
         logger.error(f"Health check failed: {str(e)}")
         return jsonify({
             'status': 'unhealthy',
@@ -2411,35 +3167,46 @@ def health_check():
             'error': str(e)
         }), 503
 
+# Rendered HTML per template, reused while its ETag still matches
+_rendered_pages = {}
+
+def static_page(template, cache_control='public, max-age=3600, stale-while-revalidate=86400'):
+    """Serve a page that only changes on deploy, answering revalidation without rendering"""
+    source = app.jinja_env.get_template(template).filename
+    etag = hashlib.md5(f"{template}:{os.path.getmtime(source)}:{APP_VERSION}".encode()).hexdigest()
+    
+    if request.if_none_match.contains(etag):
+        response = make_response('', 304)
+    else:
+        cached = _rendered_pages.get(template)
+        if cached is None or cached[0] != etag:
+            cached = (etag, render_template(template))
+            _rendered_pages[template] = cached
+        response = make_response(cached[1])
+    
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response
+
 @app.route('/privacy')
 def privacy_policy():
-    version = str(int(time.time()))
-    return render_template('privacy.html', cache_buster=version)
+    return static_page('privacy.html')
 
 @app.route('/terms')
 def terms_of_service():
-    version = str(int(time.time()))
-    return render_template('terms.html', cache_buster=version)
+    return static_page('terms.html')
 
 @app.route('/cookies')
 def cookie_policy():
-    version = str(int(time.time()))
-    return render_template('cookies.html', cache_buster=version)
+    return static_page('cookies.html')
 
 @app.route('/accessibility')
 def accessibility_statement():
-    version = str(int(time.time()))
-    return render_template('accessibility.html', cache_buster=version)
+    return static_page('accessibility.html')
 
 @app.route('/liability')
 def liability_notice():
-    version = str(int(time.time()))
-    return render_template('liability.html', cache_buster=version)
-
-@app.route('/breweries')
-def gf_breweries():
-    version = str(int(time.time()))
-    return render_template('breweries.html', cache_buster=version)
+    return static_page('liability.html')
 
 @app.route('/search')
 @app.route('/venue')
@@ -2447,8 +3214,7 @@ def gf_breweries():
 @app.route('/breweries')
 def spa_routes():
     """Handle client-side routing - always return index"""
-    version = str(int(time.time()))
-    return render_template('index.html', cache_buster=version)
+    return static_page('index.html', 'no-cache')
 
 @app.route('/<path:path>')
 def catch_all(path):
@@ -2461,8 +3227,7 @@ def catch_all(path):
         return jsonify({'error': 'Not found'}), 404
     
     # Otherwise, serve the main app (SPA routing)
-    version = str(int(time.time()))
-    return render_template('index.html', cache_buster=version)
+    return static_page('index.html', 'no-cache')
 
 # ================================================================================
 # ERROR HANDLERS
@@ -2486,6 +3251,7 @@ if __name__ == '__main__':
     debug = os.environ.get('FLASK_ENV') == 'development'
     
     logger.info(f"Starting app on port {port}, debug mode: {debug}")
+    start_venues_search_refresh()
     app.run(debug=debug, host='0.0.0.0', port=port)
 
 
@@ -0,0 +1,33 @@
+# ================================================================================
+# FULLTEXT.PY - boolean-mode FULLTEXT queries for the venue and beer searches
+# ================================================================================
+
+import re
+
+# Runs of word characters - InnoDB's parser breaks words on everything else,
+# including the boolean-mode operators, so those never reach the query
+FULLTEXT_WORD = re.compile(r'\w+')
+
+# InnoDB doesn't index words shorter than innodb_ft_min_token_size
+FULLTEXT_MIN_TOKEN = 3
+
+# InnoDB's default stopword list (INFORMATION_SCHEMA.INNODB_FT_DEFAULT_STOPWORD).
+# These are never in the index either, so a query must not require them.
+FULLTEXT_STOPWORDS = frozenset({
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en',
+    'for', 'from', 'how', 'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or',
+    'that', 'the', 'this', 'to', 'was', 'what', 'when', 'where', 'who',
+    'will', 'with', 'und', 'www'
+})
+
+def fulltext_prefix_query(query):
+    """Turn free text into a boolean-mode query requiring a prefix match on every indexed word.
+
+    Words the index never holds - stopwords and anything shorter than
+    FULLTEXT_MIN_TOKEN - are left out, so "The Red Lion" still finds the
+    venue. Returns '' when no indexed word is left; callers then fall back
+    to an anchored LIKE.
+    """
+    terms = FULLTEXT_WORD.findall(query.lower())
+    return ' '.join(f'+{term}*' for term in terms
+                    if len(term) >= FULLTEXT_MIN_TOKEN and term not in FULLTEXT_STOPWORDS)
@@ -0,0 +1,21 @@
+# ================================================================================
+# GUNICORN SETTINGS - loaded automatically by `gunicorn app:app` (see Procfile)
+# ================================================================================
+
+import os
+
+# Almost every request spends its time waiting on MySQL or an outside API.
+# gevent workers monkey-patch the socket module, so mysql.connector's
+# pure-Python protocol yields while a query is in flight and one worker can
+# hold many requests at once instead of one.
+worker_class = os.getenv('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.getenv('GUNICORN_WORKER_CONNECTIONS', 100))
+
+# WEB_CONCURRENCY is honoured by gunicorn itself; this is only the fallback
+workers = int(os.getenv('WEB_CONCURRENCY', 4))
+
+def post_worker_init(worker):
+    # The venues_search refresh runs in the workers only, so importing app
+    # (tests, flask shell, scripts) doesn't start it
+    from app import start_venues_search_refresh
+    start_venues_search_refresh()
@@ -0,0 +1,9 @@
+-- Indexes backing /autocomplete
+-- Name and "all" lookups use word-prefix FULLTEXT matches; postcode and
+-- area lookups are anchored LIKE 'q%' and can use ordinary BTREE indexes.
+
+ALTER TABLE venues
+    ADD FULLTEXT KEY ft_venue_name (venue_name),
+    ADD FULLTEXT KEY ft_venue_all (venue_name, postcode, city, address),
+    ADD KEY idx_venue_postcode (postcode),
+    ADD KEY idx_venue_city (city);
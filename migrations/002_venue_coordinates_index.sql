@@ -0,0 +1,3 @@
+-- Index backing the bounding-box prefilter in /nearby
+ALTER TABLE venues
+    ADD KEY idx_venue_lat_lng (latitude, longitude);
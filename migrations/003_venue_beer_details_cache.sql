@@ -0,0 +1,112 @@
+-- Denormalised beer list per venue, read by /search and /nearby instead of
+-- joining venue_beers, beers and breweries on every request.
+-- Kept current by the triggers below; run with the mysql client (DELIMITER).
+
+ALTER TABLE venues
+    ADD COLUMN beer_details_cache JSON NULL,
+    ADD COLUMN beer_details_updated_at DATETIME NULL;
+
+DELIMITER //
+
+CREATE PROCEDURE RefreshVenueBeerDetails(IN p_venue_id INT)
+BEGIN
+    UPDATE venues
+    SET beer_details_cache = (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'format', vb.format,
+                'brewery', COALESCE(br.brewery_name, 'Unknown'),
+                'name', COALESCE(b.beer_name, 'Unknown'),
+                'style', COALESCE(b.style, 'Unknown')
+            ))
+            FROM venue_beers vb
+            LEFT JOIN beers b ON vb.beer_id = b.beer_id
+            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
+            WHERE vb.venue_id = p_venue_id
+        ),
+        beer_details_updated_at = NOW()
+    WHERE venue_id = p_venue_id;
+END//
+
+CREATE TRIGGER venue_beers_after_insert AFTER INSERT ON venue_beers
+FOR EACH ROW
+BEGIN
+    CALL RefreshVenueBeerDetails(NEW.venue_id);
+END//
+
+CREATE TRIGGER venue_beers_after_update AFTER UPDATE ON venue_beers
+FOR EACH ROW
+BEGIN
+    CALL RefreshVenueBeerDetails(NEW.venue_id);
+    IF OLD.venue_id <> NEW.venue_id THEN
+        CALL RefreshVenueBeerDetails(OLD.venue_id);
+    END IF;
+END//
+
+CREATE TRIGGER venue_beers_after_delete AFTER DELETE ON venue_beers
+FOR EACH ROW
+BEGIN
+    CALL RefreshVenueBeerDetails(OLD.venue_id);
+END//
+
+-- Renames are rare, so refresh every venue that lists the beer or brewery
+CREATE TRIGGER beers_after_update AFTER UPDATE ON beers
+FOR EACH ROW
+BEGIN
+    UPDATE venues v
+    SET v.beer_details_cache = (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'format', vb.format,
+                'brewery', COALESCE(br.brewery_name, 'Unknown'),
+                'name', COALESCE(b.beer_name, 'Unknown'),
+                'style', COALESCE(b.style, 'Unknown')
+            ))
+            FROM venue_beers vb
+            LEFT JOIN beers b ON vb.beer_id = b.beer_id
+            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
+            WHERE vb.venue_id = v.venue_id
+        ),
+        v.beer_details_updated_at = NOW()
+    WHERE v.venue_id IN (SELECT venue_id FROM venue_beers WHERE beer_id = NEW.beer_id);
+END//
+
+CREATE TRIGGER breweries_after_update AFTER UPDATE ON breweries
+FOR EACH ROW
+BEGIN
+    UPDATE venues v
+    SET v.beer_details_cache = (
+            SELECT JSON_ARRAYAGG(JSON_OBJECT(
+                'format', vb.format,
+                'brewery', COALESCE(br.brewery_name, 'Unknown'),
+                'name', COALESCE(b.beer_name, 'Unknown'),
+                'style', COALESCE(b.style, 'Unknown')
+            ))
+            FROM venue_beers vb
+            LEFT JOIN beers b ON vb.beer_id = b.beer_id
+            LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
+            WHERE vb.venue_id = v.venue_id
+        ),
+        v.beer_details_updated_at = NOW()
+    WHERE v.venue_id IN (
+        SELECT vb.venue_id FROM venue_beers vb
+        JOIN beers b ON vb.beer_id = b.beer_id
+        WHERE b.brewery_id = NEW.brewery_id
+    );
+END//
+
+DELIMITER ;
+
+-- Backfill existing venues
+UPDATE venues v
+SET v.beer_details_cache = (
+        SELECT JSON_ARRAYAGG(JSON_OBJECT(
+            'format', vb.format,
+            'brewery', COALESCE(br.brewery_name, 'Unknown'),
+            'name', COALESCE(b.beer_name, 'Unknown'),
+            'style', COALESCE(b.style, 'Unknown')
+        ))
+        FROM venue_beers vb
+        LEFT JOIN beers b ON vb.beer_id = b.beer_id
+        LEFT JOIN breweries br ON b.brewery_id = br.brewery_id
+        WHERE vb.venue_id = v.venue_id
+    ),
+    v.beer_details_updated_at = NOW();
@@ -0,0 +1,7 @@
+-- Let /autocomplete read venues in name order and check the GF filter
+-- from the index alone
+ALTER TABLE venues
+    ADD KEY idx_venue_name_id (venue_name, venue_id);
+
+ALTER TABLE gf_status
+    ADD KEY idx_gf_status_venue_status (venue_id, status);
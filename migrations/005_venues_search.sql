@@ -0,0 +1,29 @@
+-- Read model for /autocomplete, /search and /nearby: one row per venue with
+-- its GF status and beer list already joined in, so those queries touch a
+-- single table. Rewritten per venue after each write (refresh_venues_search
+-- in app.py) and, for venues changed elsewhere, by the app's incremental
+-- background refresh (migration 015).
+
+CREATE TABLE venues_search AS
+SELECT
+    v.venue_id,
+    v.venue_name,
+    v.address,
+    v.postcode,
+    v.city,
+    v.latitude,
+    v.longitude,
+    COALESCE(s.status, 'unknown') AS gf_status,
+    v.beer_details_cache AS beer_details
+FROM venues v
+LEFT JOIN gf_status s ON v.venue_id = s.venue_id;
+
+ALTER TABLE venues_search
+    ADD PRIMARY KEY (venue_id),
+    ADD FULLTEXT KEY ft_vs_name (venue_name),
+    ADD FULLTEXT KEY ft_vs_all (venue_name, postcode, city, address),
+    ADD KEY idx_vs_postcode (postcode),
+    ADD KEY idx_vs_city (city),
+    ADD KEY idx_vs_name_id (venue_name, venue_id),
+    ADD KEY idx_vs_lat_lng (latitude, longitude),
+    ADD KEY idx_vs_gf_status (gf_status);
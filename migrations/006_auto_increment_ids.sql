@@ -0,0 +1,7 @@
+-- Let MySQL allocate brewery and beer ids instead of MAX(id) + 1 in the app,
+-- which raced between concurrent submissions
+ALTER TABLE breweries
+    MODIFY brewery_id INT NOT NULL AUTO_INCREMENT;
+
+ALTER TABLE beers
+    MODIFY beer_id INT NOT NULL AUTO_INCREMENT;
@@ -0,0 +1,12 @@
+-- One report row per venue, beer and format, so submit_beer_update can
+-- upsert with INSERT ... ON DUPLICATE KEY UPDATE.
+-- Drop duplicates left by concurrent submissions first, keeping the oldest.
+DELETE vb FROM venue_beers vb
+JOIN venue_beers keep
+    ON keep.venue_id = vb.venue_id
+    AND keep.beer_id = vb.beer_id
+    AND keep.format = vb.format
+    AND keep.report_id < vb.report_id;
+
+ALTER TABLE venue_beers
+    ADD UNIQUE KEY uq_venue_beer_format (venue_id, beer_id, format);
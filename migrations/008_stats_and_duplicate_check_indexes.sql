@@ -0,0 +1,8 @@
+-- /api/stats: GF venue counts, overall and since the first of the month
+ALTER TABLE gf_status
+    ADD KEY idx_gf_status_status_updated (status, updated_at);
+
+-- /api/add-venue duplicate check by postcode and name. The map query and the
+-- no-postcode duplicate check use idx_venue_lat_lng from migration 002.
+ALTER TABLE venues
+    ADD KEY idx_venue_postcode_name (postcode, venue_name);
@@ -0,0 +1,7 @@
+-- Beer name lookups from the report form (/api/beers/search and
+-- /api/brewery/<name>/beers): anchored LIKE 'q%' for short queries, word-prefix
+-- FULLTEXT from three characters. The prefix LIKE uses the existing
+-- idx_beer_name.
+ALTER TABLE beers
+    ADD FULLTEXT KEY ft_beer_name (beer_name),
+    ADD KEY idx_beer_brewery_name (brewery_id, beer_name);
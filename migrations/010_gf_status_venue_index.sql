@@ -0,0 +1,4 @@
+-- Intentionally empty. gf_status joins on venue_id are covered by
+-- idx_gf_status_venue_status, which migration 004 already creates; the
+-- file is kept so the migrations stay numbered without a gap.
+SELECT 1;
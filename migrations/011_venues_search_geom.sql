@@ -0,0 +1,10 @@
+-- R-tree index for /nearby: a point per venue (x = longitude, y = latitude)
+-- so the bounding box is an MBRContains() range lookup on the spatial index
+-- and ST_Distance_Sphere() trims it to the radius. The optimizer only uses a
+-- spatial index on a NOT NULL column with an SRID attribute; venues without
+-- coordinates get POINT(0, 0) and are excluded by the query's latitude check.
+-- The column is generated, so refresh_venues_search needs no change.
+ALTER TABLE venues_search
+    ADD COLUMN geom POINT SRID 0
+        AS (POINT(COALESCE(longitude, 0), COALESCE(latitude, 0))) STORED NOT NULL,
+    ADD SPATIAL KEY sp_vs_geom (geom);
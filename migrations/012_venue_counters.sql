@@ -0,0 +1,27 @@
+-- Maintained row counts, read by /api/stats instead of COUNT(*) over the
+-- whole venues clustered index. Kept exact by the triggers below; run with
+-- the mysql client (DELIMITER).
+
+CREATE TABLE venue_counters (
+    name VARCHAR(32) NOT NULL PRIMARY KEY,
+    value INT NOT NULL
+);
+
+INSERT INTO venue_counters (name, value)
+SELECT 'total_venues', COUNT(*) FROM venues;
+
+DELIMITER //
+
+CREATE TRIGGER venues_count_after_insert AFTER INSERT ON venues
+FOR EACH ROW
+BEGIN
+    UPDATE venue_counters SET value = value + 1 WHERE name = 'total_venues';
+END//
+
+CREATE TRIGGER venues_count_after_delete AFTER DELETE ON venues
+FOR EACH ROW
+BEGIN
+    UPDATE venue_counters SET value = value - 1 WHERE name = 'total_venues';
+END//
+
+DELIMITER ;
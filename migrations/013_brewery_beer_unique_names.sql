@@ -0,0 +1,55 @@
+-- One brewery per name and one beer per (brewery, name), so submit_beer_update
+-- can insert with ON DUPLICATE KEY UPDATE and concurrent reports of the same
+-- new brewery or beer land on a single row. Names compare case-insensitively
+-- through the column collation.
+-- Merge existing duplicates into the lowest id first, repointing what
+-- references them.
+
+CREATE TEMPORARY TABLE brewery_keep AS
+SELECT brewery_name, MIN(brewery_id) AS brewery_id
+FROM breweries
+GROUP BY brewery_name
+HAVING COUNT(*) > 1;
+
+UPDATE beers b
+JOIN breweries br ON br.brewery_id = b.brewery_id
+JOIN brewery_keep keep ON keep.brewery_name = br.brewery_name
+SET b.brewery_id = keep.brewery_id
+WHERE b.brewery_id <> keep.brewery_id;
+
+DELETE br FROM breweries br
+JOIN brewery_keep keep ON keep.brewery_name = br.brewery_name
+WHERE br.brewery_id <> keep.brewery_id;
+
+CREATE TEMPORARY TABLE beer_keep AS
+SELECT brewery_id, beer_name, MIN(beer_id) AS beer_id
+FROM beers
+GROUP BY brewery_id, beer_name
+HAVING COUNT(*) > 1;
+
+-- A report that already exists for the kept beer stays as it is; the
+-- duplicate's report is dropped below
+UPDATE IGNORE venue_beers vb
+JOIN beers b ON b.beer_id = vb.beer_id
+JOIN beer_keep keep ON keep.brewery_id = b.brewery_id AND keep.beer_name = b.beer_name
+SET vb.beer_id = keep.beer_id
+WHERE vb.beer_id <> keep.beer_id;
+
+DELETE vb FROM venue_beers vb
+JOIN beers b ON b.beer_id = vb.beer_id
+JOIN beer_keep keep ON keep.brewery_id = b.brewery_id AND keep.beer_name = b.beer_name
+WHERE vb.beer_id <> keep.beer_id;
+
+DELETE b FROM beers b
+JOIN beer_keep keep ON keep.brewery_id = b.brewery_id AND keep.beer_name = b.beer_name
+WHERE b.beer_id <> keep.beer_id;
+
+DROP TEMPORARY TABLE brewery_keep, beer_keep;
+
+ALTER TABLE breweries
+    ADD UNIQUE KEY uq_brewery_name (brewery_name);
+
+-- The unique key serves the lookups idx_beer_brewery_name (migration 009) did
+ALTER TABLE beers
+    ADD UNIQUE KEY uq_beer_brewery_name (brewery_id, beer_name),
+    DROP KEY idx_beer_brewery_name;
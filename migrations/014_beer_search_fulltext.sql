@@ -0,0 +1,9 @@
+-- /api/search-by-beer: word-prefix FULLTEXT matches on brewery name and
+-- style, alongside ft_beer_name from migration 009, instead of LIKE '%q%'
+-- scans. Queries under three characters use an anchored LIKE on the same
+-- columns (uq_brewery_name from migration 013 serves the brewery side).
+ALTER TABLE breweries
+    ADD FULLTEXT KEY ft_brewery_name (brewery_name);
+
+ALTER TABLE beers
+    ADD FULLTEXT KEY ft_beer_style (style);
@@ -0,0 +1,20 @@
+-- Incremental refresh of venues_search: the background loop rewrites only
+-- venues whose row or GF status changed since its last run, and records that
+-- run here so the other workers skip theirs until the interval has passed.
+-- venues.updated_at also moves when the beer_details_cache triggers from
+-- migration 003 rewrite the row.
+ALTER TABLE venues
+    ADD COLUMN updated_at DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    ADD KEY idx_venues_updated_at (updated_at);
+
+ALTER TABLE gf_status
+    ADD KEY idx_gf_status_updated (updated_at);
+
+CREATE TABLE venues_search_refresh (
+    name VARCHAR(32) NOT NULL PRIMARY KEY,
+    refreshed_at DATETIME NOT NULL
+);
+
+-- The first run catches up everything changed since migration 005
+INSERT INTO venues_search_refresh (name, refreshed_at)
+VALUES ('venues_search', '1970-01-01 00:00:00');
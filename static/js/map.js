@@ -1027,6 +1027,27 @@ export const MapModule = (() => {
         });
     };
     
+    // Map pins only carry name, position and status - fetch the address the
+    // first time a pin's popup is opened and keep it on the venue
+    const bindVenuePopup = (marker, venue, gfStatus) => {
+        marker.bindPopup(createVenuePopupContent(venue, gfStatus));
+        
+        if (venue.address !== undefined) return;
+        
+        marker.once('popupopen', async () => {
+            try {
+                const response = await fetch(`/api/venue/${venue.venue_id}`);
+                if (!response.ok) return;
+                
+                const data = await response.json();
+                Object.assign(venue, data.venue);
+                marker.setPopupContent(createVenuePopupContent(venue, gfStatus));
+            } catch (error) {
+                console.error('❌ Error loading venue details:', error);
+            }
+        });
+    };
+    
     const displayGFVenuesOnly = (map, allVenues) => {
         const gfVenuesLayer = L.layerGroup().addTo(map);
         window.App.setState(STATE_KEYS.MAP_DATA.GF_VENUES_LAYER, gfVenuesLayer);
@@ -1048,8 +1069,7 @@ export const MapModule = (() => {
             const markerStyle = getMarkerStyleForGFStatus(gfStatus);
             
             const marker = L.circleMarker([lat, lng], markerStyle);
-            const popupContent = createVenuePopupContent(venue, gfStatus);
-            marker.bindPopup(popupContent);
+            bindVenuePopup(marker, venue, gfStatus);
             
             gfVenuesLayer.addLayer(marker);
         });
@@ -1092,8 +1112,7 @@ export const MapModule = (() => {
             const marker = L.circleMarker([lat, lng], markerStyle);
             marker.options.venueId = venue.venue_id;
             
-            const popupContent = createVenuePopupContent(venue, gfStatus);
-            marker.bindPopup(popupContent);
+            bindVenuePopup(marker, venue, gfStatus);
             
             // Add GF venues to their own layer, others to cluster
             if (gfStatus === 'always_tap_cask' || gfStatus === 'always_bottle_can' || gfStatus === 'currently') {
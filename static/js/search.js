@@ -1476,7 +1476,16 @@ export const SearchModule = (function() {
     // HELPERS
     // ================================
     const sortVenuesByDistance = (venues, location) => {
+        // /search and /nearby already return distances in order when they
+        // have the user's location - only fill in and re-sort what's missing
+        if (venues.every(venue => typeof venue.distance === 'number')) {
+            return venues;
+        }
+        
         return venues.map(venue => {
+            if (typeof venue.distance === 'number') {
+                return venue;
+            }
             if (venue.latitude && venue.longitude) {
                 venue.distance = calculateDistance(location, venue);
             } else {
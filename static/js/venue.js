@@ -249,7 +249,11 @@ export const VenueModule = (function() {
         beerSection.style.cursor = 'pointer';
         beerSection.setAttribute('data-action', 'show-beer-list');
         
-        const beerCount = venue.beer_details ? venue.beer_details.split(',').length : 0;
+        // beer_details is a list of {format, brewery, name, style}; older
+        // cached results may still carry the comma-joined string
+        const beerCount = Array.isArray(venue.beer_details) ?
+            venue.beer_details.length :
+            (venue.beer_details ? venue.beer_details.split(',').length : 0);
         
         // Always show the section with appropriate message
         beerEl.innerHTML = `
@@ -0,0 +1,96 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+from app import app, parse_bbox, suggestion_paging, take_total, SUGGESTION_LIMIT, SUGGESTION_LIMIT_MAX
+
+
+BREWERIES = ['Beavertown', 'Brew York', 'Cloudwater', 'Northern Monk',
+             'Thornbridge', 'Wild Beer Co', 'Wiper and True']
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(app_module, 'get_brewery_index',
+                        lambda: ([name.lower() for name in BREWERIES], BREWERIES))
+    return app.test_client()
+
+
+def test_breweries_prefix_matches_come_before_substring_matches(client):
+    assert client.get('/api/breweries?q=br').get_json() == ['Brew York', 'Thornbridge']
+    assert client.get('/api/breweries?q=BE').get_json() == ['Beavertown', 'Wild Beer Co']
+
+
+def test_breweries_pages_across_prefix_and_substring_matches(client):
+    assert client.get('/api/breweries?q=br&limit=1').get_json() == ['Brew York']
+    assert client.get('/api/breweries?q=br&limit=1&offset=1').get_json() == ['Thornbridge']
+    assert client.get('/api/breweries?q=br&limit=1&offset=2').get_json() == []
+
+
+def test_breweries_unfiltered_page(client):
+    assert client.get('/api/breweries?limit=2&offset=3').get_json() == ['Northern Monk', 'Thornbridge']
+
+
+def test_parse_bbox_rounds_outwards():
+    assert parse_bbox('-1.23456,53.12345,-1.01234,53.45678') == (-1.235, 53.123, -1.012, 53.457)
+
+
+@pytest.mark.parametrize('value', [
+    '', '1,2,3', '1,2,3,4,5', 'a,b,c,d',
+    '2,50,1,51',        # min longitude past max
+    '1,51,2,50',        # min latitude past max
+    '-181,50,1,51', '1,50,2,91',
+])
+def test_parse_bbox_rejects_invalid_bounds(value):
+    assert parse_bbox(value) is None
+
+
+@pytest.mark.parametrize('query, filtered, expected', [
+    ('', True, (SUGGESTION_LIMIT, 0)),
+    ('', False, (None, 0)),
+    ('?limit=5&offset=10', False, (5, 10)),
+    ('?limit=0', True, (1, 0)),
+    ('?limit=100000', True, (SUGGESTION_LIMIT_MAX, 0)),
+    ('?offset=-5', True, (SUGGESTION_LIMIT, 0)),
+    ('?limit=abc', True, (SUGGESTION_LIMIT, 0)),
+])
+def test_suggestion_paging_clamps(query, filtered, expected):
+    with app.test_request_context(f'/api/breweries{query}'):
+        assert suggestion_paging(filtered) == expected
+
+
+def test_suggestion_paging_unfiltered_default():
+    with app.test_request_context('/api/beers'):
+        assert suggestion_paging(False, default_unfiltered=500) == (500, 0)
+
+
+def test_take_total_strips_the_window_count():
+    rows = [{'venue_id': 1, 'total_results': 42}, {'venue_id': 2, 'total_results': 42}]
+    assert take_total(rows) == 42
+    assert rows == [{'venue_id': 1}, {'venue_id': 2}]
+
+
+def test_take_total_of_an_empty_page():
+    assert take_total([]) == 0
+
+
+def test_json_encode_matches_the_default_provider():
+    body = app.json.encode({
+        'b': 1,
+        'a': Decimal('4.50'),
+        'seen': datetime(2024, 5, 1, 12, 30),
+        'added': date(2024, 5, 1),
+    })
+    assert body == (b'{"a":"4.50","added":"Wed, 01 May 2024 00:00:00 GMT",'
+                    b'"b":1,"seen":"Wed, 01 May 2024 12:30:00 GMT"}')
+
+
+def test_jsonify_and_encode_agree():
+    data = {'z': [1, 2], 'a': Decimal('1.1')}
+    with app.app_context():
+        assert app.json.response(data).get_data() == app.json.encode(data)
@@ -0,0 +1,37 @@
+from fulltext import fulltext_prefix_query
+
+
+def test_every_indexed_word_is_a_required_prefix():
+    assert fulltext_prefix_query('red lion') == '+red* +lion*'
+
+
+def test_stopwords_are_not_required():
+    assert fulltext_prefix_query('The Red Lion') == '+red* +lion*'
+    assert fulltext_prefix_query('Rose and Crown at the Quay') == '+rose* +and* +crown* +quay*'
+
+
+def test_short_words_are_not_required():
+    assert fulltext_prefix_query('St Albans Arms') == '+albans* +arms*'
+    assert fulltext_prefix_query('Ye Olde Cheshire Cheese') == '+olde* +cheshire* +cheese*'
+
+
+def test_nothing_indexable_returns_empty():
+    assert fulltext_prefix_query('S2') == ''
+    assert fulltext_prefix_query('the') == ''
+    assert fulltext_prefix_query('ye of') == ''
+
+
+def test_operators_are_stripped():
+    assert fulltext_prefix_query('+red -lion* "tap"') == '+red* +lion* +tap*'
+    assert fulltext_prefix_query('++ --') == ''
+
+
+def test_hyphens_break_words():
+    assert fulltext_prefix_query('Stratford-upon-Avon') == '+stratford* +upon* +avon*'
+    assert fulltext_prefix_query('Hop-Back Brewery') == '+hop* +back* +brewery*'
+
+
+def test_punctuation_is_not_part_of_a_word():
+    assert fulltext_prefix_query('Bury St. Edmunds') == '+bury* +edmunds*'
+    assert fulltext_prefix_query("O'Neill's, Leeds") == '+neill* +leeds*'
+    assert fulltext_prefix_query('St.') == ''